@@ -7,87 +7,304 @@ Limpeza profunda de cache, registro e otimização de disco
 
 import os
 import sys
+import ctypes
+from ctypes import wintypes
 import shutil
 import tempfile
 import winreg
 import subprocess
 import glob
+import threading
+import time
+import functools
+import contextlib
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 from utils.logger import Logger
 from utils.config import Config
+from utils.system_integration import flush_dns_cache
+
+# Limite de threads para limpeza simultânea de pastas raiz
+MAX_CLEANUP_WORKERS = 8
+
+# Threads de remoção de arquivos (compartilhadas por todas as pastas raiz),
+# arquivos por lote enviado a elas e lotes pendentes por pasta antes de a
+# enumeração esperar pelo mais antigo
+UNLINK_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+UNLINK_BATCH_SIZE = 256
+UNLINK_MAX_PENDING_BATCHES = UNLINK_WORKERS * 2
+
+# Subpastas de cache dentro de cada perfil do Firefox
+FIREFOX_CACHE_SUBFOLDERS = ('cache2', 'startupCache', 'OfflineCache')
+
+# Extensões removidas das pastas de log
+LOG_EXTENSIONS = ('.log', '.dmp', '.tmp')
+
+# Argumento de tratamento de erro do shutil.rmtree (onexc a partir do Python 3.12)
+RMTREE_ERROR_KW = 'onexc' if sys.version_info >= (3, 12) else 'onerror'
+
+# Validade (s) do resultado em cache da varredura de uma pasta no preview
+PREVIEW_CACHE_TTL = 30.0
+
+# Variáveis de ambiente das quais dependem os caminhos de limpeza
+CLEANUP_PATH_ENV_VARS = ('TEMP', 'TMP', 'WINDIR', 'USERPROFILE', 'LOCALAPPDATA', 'APPDATA')
+
+# Serviços parados durante a limpeza do cache do Windows Update
+WINDOWS_UPDATE_SERVICES = "wuauserv,cryptSvc,bits,msiserver"
+
+# Enumeração nativa (FindFirstFileExW) usada nas varreduras que só somam tamanhos
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 0x2
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# SetThreadErrorMode: falhas em unidades removíveis viram erros comuns, sem caixa de diálogo
+SEM_FAILCRITICALERRORS = 0x0001
+SEM_NOOPENFILEERRORBOX = 0x8000
+
+# Flags de SHEmptyRecycleBinW: sem confirmação, sem barra de progresso e sem som
+SHERB_NOCONFIRMATION = 0x1
+SHERB_NOPROGRESSUI = 0x2
+SHERB_NOSOUND = 0x4
+# HRESULT devolvido por SHEmptyRecycleBinW quando a lixeira já está vazia
+E_UNEXPECTED = -2147418113
+
+
+class SHQUERYRBINFO(ctypes.Structure):
+    """Estrutura preenchida por SHQueryRecycleBinW"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("i64Size", ctypes.c_int64),
+        ("i64NumItems", ctypes.c_int64),
+    ]
+
+
+if os.name == 'nt':
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _FindFirstFileExW = _kernel32.FindFirstFileExW
+    _FindFirstFileExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int,
+                                  ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                                  ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    _FindFirstFileExW.restype = wintypes.HANDLE
+    _FindNextFileW = _kernel32.FindNextFileW
+    _FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _FindNextFileW.restype = wintypes.BOOL
+    _FindClose = _kernel32.FindClose
+    _FindClose.argtypes = [wintypes.HANDLE]
+    _FindClose.restype = wintypes.BOOL
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    _DeleteFileW = _kernel32.DeleteFileW
+    _DeleteFileW.argtypes = [wintypes.LPCWSTR]
+    _DeleteFileW.restype = wintypes.BOOL
+    _RemoveDirectoryW = _kernel32.RemoveDirectoryW
+    _RemoveDirectoryW.argtypes = [wintypes.LPCWSTR]
+    _RemoveDirectoryW.restype = wintypes.BOOL
+    _GetThreadErrorMode = _kernel32.GetThreadErrorMode
+    _GetThreadErrorMode.argtypes = []
+    _GetThreadErrorMode.restype = wintypes.DWORD
+    _SetThreadErrorMode = _kernel32.SetThreadErrorMode
+    _SetThreadErrorMode.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+    _SetThreadErrorMode.restype = wintypes.BOOL
+
+    def _remove_file(path: str):
+        """os.remove direto em DeleteFileW, sem as conversões do wrapper do Python"""
+        if not _DeleteFileW(path):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def _remove_dir(path: str):
+        """os.rmdir direto em RemoveDirectoryW"""
+        if not _RemoveDirectoryW(path):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    _shell32 = ctypes.WinDLL('shell32')
+    _SHEmptyRecycleBinW = _shell32.SHEmptyRecycleBinW
+    _SHEmptyRecycleBinW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.DWORD]
+    _SHEmptyRecycleBinW.restype = ctypes.c_long
+    _SHQueryRecycleBinW = _shell32.SHQueryRecycleBinW
+    _SHQueryRecycleBinW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(SHQUERYRBINFO)]
+    _SHQueryRecycleBinW.restype = ctypes.c_long
+else:  # pragma: no cover - Non Windows fallback
+    _kernel32 = None
+    _remove_file = os.remove
+    _remove_dir = os.rmdir
+    _SetThreadErrorMode = None
+    _shell32 = None
+
+# Pools compartilhados por todas as limpezas, inclusive pelas etapas simultâneas
+# de full_system_cleanup: o total de threads de varredura e de remoção no disco
+# fica limitado a MAX_CLEANUP_WORKERS + UNLINK_WORKERS, sem pools aninhados por
+# pasta. As tarefas do _tree_pool só enviam trabalho ao _unlink_pool, que não
+# envia nada, então nenhuma espera depende do próprio pool.
+_tree_pool = ThreadPoolExecutor(max_workers=MAX_CLEANUP_WORKERS, thread_name_prefix="FPSPackCleanup")
+_unlink_pool = ThreadPoolExecutor(max_workers=UNLINK_WORKERS, thread_name_prefix="FPSPackUnlink")
+
+
+@contextlib.contextmanager
+def _no_error_dialogs():
+    """Desliga as caixas de erro do Windows só na thread atual, durante a varredura/remoção
+    
+    O modo anterior da thread é restaurado na saída; o modo do processo (e da
+    thread da GUI) não é alterado. Também serve como decorador.
+    """
+    if _SetThreadErrorMode is None:
+        yield
+        return
+        
+    previous = wintypes.DWORD()
+    _SetThreadErrorMode(_GetThreadErrorMode() | SEM_FAILCRITICALERRORS | SEM_NOOPENFILEERRORBOX,
+                        ctypes.byref(previous))
+    try:
+        yield
+    finally:
+        _SetThreadErrorMode(previous.value, None)
+
+
+def _unique_paths(candidates: List[str]) -> Tuple[str, ...]:
+    """Filtra caminhos vazios ou duplicados"""
+    unique = {}
+    for path in candidates:
+        if path:
+            unique.setdefault(os.path.normcase(os.path.normpath(path)), path)
+    return tuple(unique.values())
+
+
+def _existing_paths(paths: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Mantém só os caminhos que existem agora (verificado a cada uso)"""
+    return tuple(path for path in paths if os.path.exists(path))
+
+
+@functools.lru_cache(maxsize=1)
+def _build_cleanup_paths(env: Tuple[str, ...]):
+    """Monta os caminhos de limpeza para os valores de CLEANUP_PATH_ENV_VARS
+    
+    O resultado fica em cache por ambiente: preview e limpeza criam instâncias
+    diferentes de CleanupEngine, mas só a primeira monta os caminhos. Cada
+    lista guarda os candidatos sem duplicatas, como tupla imutável (as listas
+    são lidas por várias threads durante a limpeza). A existência não entra no
+    cache: pastas criadas depois (ex.: Minidump, navegador instalado) são
+    verificadas a cada preview ou limpeza (ver _existing_paths).
+    
+    Returns:
+        (temp, cache, logs, cache de navegadores, pares (caminho, navegador),
+        raízes de perfis do Firefox)
+    """
+    temp, tmp, windir, user_profile, local_appdata, appdata = env
+    
+    def join(base: str, *parts: str) -> str:
+        # Sem a variável base o caminho ficaria relativo ao diretório atual
+        return os.path.join(base, *parts) if base else ''
+        
+    # Pastas temporárias
+    temp_folders = _unique_paths([
+        temp,
+        tmp,
+        join(windir, 'Temp'),
+        join(local_appdata, 'Temp'),
+        join(user_profile, 'AppData', 'Local', 'Temp')
+    ])
+    
+    # Cache do sistema
+    cache_folders = _unique_paths([
+        join(windir, 'Prefetch'),
+        join(windir, 'SoftwareDistribution', 'Download'),
+        join(local_appdata, 'Microsoft', 'Windows', 'INetCache'),
+        join(local_appdata, 'Microsoft', 'Windows', 'WebCache'),
+        join(appdata, 'Microsoft', 'Windows', 'Recent'),
+        join(local_appdata, 'IconCache.db')
+    ])
+    
+    # Logs do sistema
+    log_folders = _unique_paths([
+        join(windir, 'Logs'),
+        join(windir, 'Debug'),
+        join(windir, 'Minidump'),
+        join(windir, 'memory.dmp'),
+        join(local_appdata, 'CrashDumps')
+    ])
+    
+    # Cache de navegadores (caminho, navegador)
+    browser_caches = [
+        # Chrome
+        (join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'Cache'), 'Google Chrome'),
+        (join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'Code Cache'), 'Google Chrome'),
+        (join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'GPUCache'), 'Google Chrome'),
+        
+        # Edge
+        (join(local_appdata, 'Microsoft', 'Edge', 'User Data', 'Default', 'Cache'), 'Microsoft Edge'),
+        (join(local_appdata, 'Microsoft', 'Edge', 'User Data', 'Default', 'Code Cache'), 'Microsoft Edge'),
+        
+        # Opera
+        (join(appdata, 'Opera Software', 'Opera Stable', 'Cache'), 'Opera'),
+        
+        # Brave
+        (join(local_appdata, 'BraveSoftware', 'Brave-Browser', 'User Data', 'Default', 'Cache'), 'Brave')
+    ]
+    browser_cache_folders = _unique_paths([path for path, _ in browser_caches])
+    browser_by_path = tuple((path, browser) for path, browser in browser_caches if path)
+    
+    # Firefox: só as subpastas de cache de cada perfil (ver _firefox_cache_folders)
+    firefox_profile_roots = _unique_paths([
+        join(appdata, 'Mozilla', 'Firefox', 'Profiles'),
+        join(local_appdata, 'Mozilla', 'Firefox', 'Profiles')
+    ])
+    
+    return (temp_folders, cache_folders, log_folders, browser_cache_folders,
+            browser_by_path, firefox_profile_roots)
+
 
 class CleanupEngine:
     def __init__(self):
         self.logger = Logger()
         self.config = Config()
-        self.temp_folders = []
-        self.cache_folders = []
-        self.log_folders = []
-        self.browser_cache_folders = []
+        # Candidatos; as propriedades abaixo devolvem só os que existem
+        self._temp_candidates: Tuple[str, ...] = ()
+        self._cache_candidates: Tuple[str, ...] = ()
+        self._log_candidates: Tuple[str, ...] = ()
+        self._browser_cache_candidates: Tuple[str, ...] = ()
+        self._browser_by_path: Dict[str, str] = {}
+        self._firefox_profile_roots: Tuple[str, ...] = ()
+        
+        # Cache do preview: (pasta, extensões) -> (instante, mtime da pasta, resultado)
+        self._preview_cache: Dict[Tuple[str, Optional[Tuple[str, ...]]], Tuple[float, float, Dict[str, any]]] = {}
+        self._preview_cache_lock = threading.Lock()
         
         self._initialize_cleanup_paths()
         
     def _initialize_cleanup_paths(self):
-        """Inicializa caminhos para limpeza"""
+        """Inicializa caminhos para limpeza a partir do snapshot compartilhado
+        
+        As tuplas são imutáveis e podem ser compartilhadas entre instâncias; o
+        mapa de navegadores é copiado porque _firefox_cache_folders o amplia.
+        """
         try:
-            # Pastas temporárias
-            self.temp_folders = [
-                os.environ.get('TEMP', ''),
-                os.environ.get('TMP', ''),
-                os.path.join(os.environ.get('WINDIR', ''), 'Temp'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Temp'),
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Temp')
-            ]
-            
-            # Cache do sistema
-            self.cache_folders = [
-                os.path.join(os.environ.get('WINDIR', ''), 'Prefetch'),
-                os.path.join(os.environ.get('WINDIR', ''), 'SoftwareDistribution', 'Download'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'INetCache'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'WebCache'),
-                os.path.join(os.environ.get('APPDATA', ''), 'Microsoft', 'Windows', 'Recent'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'IconCache.db')
-            ]
-            
-            # Logs do sistema
-            self.log_folders = [
-                os.path.join(os.environ.get('WINDIR', ''), 'Logs'),
-                os.path.join(os.environ.get('WINDIR', ''), 'Debug'),
-                os.path.join(os.environ.get('WINDIR', ''), 'Minidump'),
-                os.path.join(os.environ.get('WINDIR', ''), 'memory.dmp'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'CrashDumps')
-            ]
-            
-            # Cache de navegadores
-            user_profile = os.environ.get('USERPROFILE', '')
-            local_appdata = os.environ.get('LOCALAPPDATA', '')
-            appdata = os.environ.get('APPDATA', '')
-            
-            self.browser_cache_folders = [
-                # Chrome
-                os.path.join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'Cache'),
-                os.path.join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'Code Cache'),
-                os.path.join(local_appdata, 'Google', 'Chrome', 'User Data', 'Default', 'GPUCache'),
-                
-                # Firefox
-                os.path.join(appdata, 'Mozilla', 'Firefox', 'Profiles'),
-                os.path.join(local_appdata, 'Mozilla', 'Firefox', 'Profiles'),
-                
-                # Edge
-                os.path.join(local_appdata, 'Microsoft', 'Edge', 'User Data', 'Default', 'Cache'),
-                os.path.join(local_appdata, 'Microsoft', 'Edge', 'User Data', 'Default', 'Code Cache'),
-                
-                # Opera
-                os.path.join(appdata, 'Opera Software', 'Opera Stable', 'Cache'),
-                
-                # Brave
-                os.path.join(local_appdata, 'BraveSoftware', 'Brave-Browser', 'User Data', 'Default', 'Cache')
-            ]
+            env = tuple(os.environ.get(name, '') for name in CLEANUP_PATH_ENV_VARS)
+            (self._temp_candidates, self._cache_candidates, self._log_candidates,
+             self._browser_cache_candidates, browser_by_path,
+             self._firefox_profile_roots) = _build_cleanup_paths(env)
+            self._browser_by_path = dict(browser_by_path)
             
         except Exception as e:
             self.logger.error(f"Erro ao inicializar caminhos de limpeza: {e}")
             
+    @property
+    def temp_folders(self) -> Tuple[str, ...]:
+        return _existing_paths(self._temp_candidates)
+        
+    @property
+    def cache_folders(self) -> Tuple[str, ...]:
+        return _existing_paths(self._cache_candidates)
+        
+    @property
+    def log_folders(self) -> Tuple[str, ...]:
+        return _existing_paths(self._log_candidates)
+        
+    @property
+    def browser_cache_folders(self) -> Tuple[str, ...]:
+        return _existing_paths(self._browser_cache_candidates)
+            
     def full_system_cleanup(self) -> Dict[str, any]:
         """Executa limpeza completa do sistema"""
         try:
@@ -96,14 +313,20 @@ class CleanupEngine:
             # Execute only safe, non-destructive cleaning steps by default.
             # More aggressive steps (registry, windows update) remain available
             # but will only run when explicitly requested by the UI with admin consent.
-            results = {
-                "temp_files": self.clean_temp_files(),
-                "system_cache": self.clean_system_cache(),
-                "browser_cache": self.clean_browser_cache(),
-                "logs": self.clean_system_logs(),
-                "recycle_bin": self.empty_recycle_bin()
+            phases = {
+                "temp_files": self.clean_temp_files,
+                "system_cache": self.clean_system_cache,
+                "browser_cache": self.clean_browser_cache,
+                "logs": self.clean_system_logs,
+                "recycle_bin": self.empty_recycle_bin
             }
             
+            # As etapas não dependem umas das outras: roda todas ao mesmo tempo
+            with ThreadPoolExecutor(max_workers=len(phases),
+                                    thread_name_prefix="FPSPackFullCleanup") as executor:
+                futures = {name: executor.submit(phase) for name, phase in phases.items()}
+            results = {name: future.result() for name, future in futures.items()}
+            
             # Calcula totais
             total_files_cleaned = sum(r.get("files_cleaned", 0) for r in results.values() if isinstance(r, dict))
             total_space_freed = sum(r.get("space_freed_mb", 0) for r in results.values() if isinstance(r, dict))
@@ -131,12 +354,10 @@ class CleanupEngine:
             space_freed = 0
             errors = []
             
-            for temp_folder in self.temp_folders:
-                if temp_folder and os.path.exists(temp_folder):
-                    folder_result = self._clean_folder(temp_folder, recursive=True)
-                    files_cleaned += folder_result["files_cleaned"]
-                    space_freed += folder_result["space_freed"]
-                    errors.extend(folder_result["errors"])
+            for folder_result in self._clean_folders_parallel(self.temp_folders, fast=True).values():
+                files_cleaned += folder_result["files_cleaned"]
+                space_freed += folder_result["space_freed"]
+                errors.extend(folder_result["errors"])
                     
             return {
                 "success": True,
@@ -158,29 +379,34 @@ class CleanupEngine:
             space_freed = 0
             errors = []
             
+            # DNS e cache de ícones rodam em segundo plano durante a varredura
+            helpers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="FPSPackCacheHelper")
+            helpers.submit(self._flush_dns_cache)
+            helpers.submit(self._clear_icon_cache)
+            
+            folders = []
             for cache_folder in self.cache_folders:
-                if cache_folder and os.path.exists(cache_folder):
-                    if os.path.isfile(cache_folder):
-                        # É um arquivo específico
-                        try:
-                            size = os.path.getsize(cache_folder)
-                            os.remove(cache_folder)
-                            files_cleaned += 1
-                            space_freed += size
-                        except Exception as e:
-                            errors.append(f"Erro ao remover {cache_folder}: {e}")
-                    else:
-                        # É uma pasta
-                        folder_result = self._clean_folder(cache_folder, recursive=True)
-                        files_cleaned += folder_result["files_cleaned"]
-                        space_freed += folder_result["space_freed"]
-                        errors.extend(folder_result["errors"])
+                if os.path.isfile(cache_folder):
+                    # É um arquivo específico
+                    try:
+                        size = os.path.getsize(cache_folder)
+                        os.remove(cache_folder)
+                        files_cleaned += 1
+                        space_freed += size
+                    except Exception as e:
+                        errors.append(f"Erro ao remover {cache_folder}: {e}")
+                else:
+                    # É uma pasta
+                    folders.append(cache_folder)
                         
-            # Limpeza específica do DNS
-            self._flush_dns_cache()
-            
-            # Limpeza do cache de ícones
-            self._clear_icon_cache()
+            try:
+                for folder_result in self._clean_folders_parallel(folders).values():
+                    files_cleaned += folder_result["files_cleaned"]
+                    space_freed += folder_result["space_freed"]
+                    errors.extend(folder_result["errors"])
+            finally:
+                # Aguarda a limpeza do DNS e do cache de ícones
+                helpers.shutdown(wait=True)
             
             return {
                 "success": True,
@@ -203,22 +429,17 @@ class CleanupEngine:
             errors = []
             browsers_cleaned = []
             
-            for cache_folder in self.browser_cache_folders:
-                if cache_folder and os.path.exists(cache_folder):
+            # Firefox entra no mesmo lote: cada pasta de cache é percorrida uma única vez
+            folders = list(self.browser_cache_folders) + self._firefox_cache_folders()
+            folder_results = self._clean_folders_parallel(folders, fast=True)
+            for cache_folder, folder_result in folder_results.items():
+                if folder_result["files_cleaned"] > 0:
                     # Identifica o navegador
-                    browser_name = self._identify_browser(cache_folder)
-                    
-                    if os.path.isdir(cache_folder):
-                        folder_result = self._clean_folder(cache_folder, recursive=True)
-                        if folder_result["files_cleaned"] > 0:
-                            browsers_cleaned.append(browser_name)
-                        files_cleaned += folder_result["files_cleaned"]
-                        space_freed += folder_result["space_freed"]
-                        errors.extend(folder_result["errors"])
+                    browsers_cleaned.append(self._identify_browser(cache_folder))
+                files_cleaned += folder_result["files_cleaned"]
+                space_freed += folder_result["space_freed"]
+                errors.extend(folder_result["errors"])
                         
-            # Limpeza específica do Firefox
-            self._clean_firefox_cache()
-            
             return {
                 "success": True,
                 "files_cleaned": files_cleaned,
@@ -240,27 +461,34 @@ class CleanupEngine:
             space_freed = 0
             errors = []
             
+            # Logs do Event Viewer são limpos em segundo plano durante a varredura
+            helpers = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FPSPackLogHelper")
+            helpers.submit(self._clear_event_logs)
+            
+            folders = []
             for log_folder in self.log_folders:
-                if log_folder and os.path.exists(log_folder):
-                    if os.path.isfile(log_folder):
-                        # É um arquivo específico (como memory.dmp)
-                        try:
-                            size = os.path.getsize(log_folder)
-                            os.remove(log_folder)
-                            files_cleaned += 1
-                            space_freed += size
-                        except Exception as e:
-                            errors.append(f"Erro ao remover {log_folder}: {e}")
-                    else:
-                        # É uma pasta
-                        folder_result = self._clean_folder(log_folder, recursive=True, 
-                                                         extensions=['.log', '.dmp', '.tmp'])
-                        files_cleaned += folder_result["files_cleaned"]
-                        space_freed += folder_result["space_freed"]
-                        errors.extend(folder_result["errors"])
+                if os.path.isfile(log_folder):
+                    # É um arquivo específico (como memory.dmp)
+                    try:
+                        size = os.path.getsize(log_folder)
+                        os.remove(log_folder)
+                        files_cleaned += 1
+                        space_freed += size
+                    except Exception as e:
+                        errors.append(f"Erro ao remover {log_folder}: {e}")
+                else:
+                    # É uma pasta
+                    folders.append(log_folder)
                         
-            # Limpeza de logs do Event Viewer
-            self._clear_event_logs()
+            try:
+                folder_results = self._clean_folders_parallel(folders, extensions=LOG_EXTENSIONS)
+                for folder_result in folder_results.values():
+                    files_cleaned += folder_result["files_cleaned"]
+                    space_freed += folder_result["space_freed"]
+                    errors.extend(folder_result["errors"])
+            finally:
+                # Aguarda a limpeza dos logs do Event Viewer
+                helpers.shutdown(wait=True)
             
             return {
                 "success": True,
@@ -317,11 +545,15 @@ class CleanupEngine:
             # Calcula tamanho antes
             recycle_bin_size = self._get_recycle_bin_size()
             
-            # Esvazia lixeira usando PowerShell
-            cmd = 'powershell -Command "Clear-RecycleBin -Force"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            if _shell32 is None:
+                return {"success": False, "error": "Lixeira suportada apenas no Windows"}
+                
+            # Esvazia lixeira chamando a API do shell diretamente (sem PowerShell)
+            hresult = _SHEmptyRecycleBinW(
+                None, None, SHERB_NOCONFIRMATION | SHERB_NOPROGRESSUI | SHERB_NOSOUND
+            )
             
-            if result.returncode == 0:
+            if hresult == 0 or (hresult == E_UNEXPECTED and recycle_bin_size == 0):
                 return {
                     "success": True,
                     "space_freed_mb": recycle_bin_size / (1024 * 1024),
@@ -330,7 +562,7 @@ class CleanupEngine:
             else:
                 return {
                     "success": False,
-                    "error": f"Erro ao esvaziar lixeira: {result.stderr}"
+                    "error": f"Erro ao esvaziar lixeira: HRESULT 0x{hresult & 0xFFFFFFFF:08X}"
                 }
                 
         except Exception as e:
@@ -342,41 +574,41 @@ class CleanupEngine:
         try:
             self.logger.info("Limpando cache do Windows Update...")
             
-            # Para o serviço Windows Update
-            subprocess.run('net stop wuauserv', shell=True, capture_output=True)
-            subprocess.run('net stop cryptSvc', shell=True, capture_output=True)
-            subprocess.run('net stop bits', shell=True, capture_output=True)
-            subprocess.run('net stop msiserver', shell=True, capture_output=True)
+            # Para os serviços do Windows Update (um único processo)
+            self._run_powershell(
+                f"Stop-Service -Name {WINDOWS_UPDATE_SERVICES} -Force -ErrorAction SilentlyContinue"
+            )
             
             files_cleaned = 0
             space_freed = 0
             
-            # Limpa pastas do Windows Update
-            update_folders = [
-                os.path.join(os.environ.get('WINDIR', ''), 'SoftwareDistribution'),
-                os.path.join(os.environ.get('WINDIR', ''), 'System32', 'catroot2')
-            ]
-            
-            for folder in update_folders:
-                if os.path.exists(folder):
-                    # Renomeia pasta para backup
-                    backup_folder = folder + '.bak'
-                    if os.path.exists(backup_folder):
-                        shutil.rmtree(backup_folder, ignore_errors=True)
-                    
-                    try:
-                        os.rename(folder, backup_folder)
-                        folder_size = self._get_folder_size(backup_folder)
-                        space_freed += folder_size
-                        files_cleaned += 1
-                    except Exception as e:
-                        self.logger.error(f"Erro ao limpar {folder}: {e}")
+            try:
+                # Limpa pastas do Windows Update
+                update_folders = [
+                    os.path.join(os.environ.get('WINDIR', ''), 'SoftwareDistribution'),
+                    os.path.join(os.environ.get('WINDIR', ''), 'System32', 'catroot2')
+                ]
+                
+                for folder in update_folders:
+                    if os.path.exists(folder):
+                        # Renomeia pasta para backup
+                        backup_folder = folder + '.bak'
+                        if os.path.exists(backup_folder):
+                            shutil.rmtree(backup_folder, ignore_errors=True)
                         
-            # Reinicia serviços
-            subprocess.run('net start wuauserv', shell=True, capture_output=True)
-            subprocess.run('net start cryptSvc', shell=True, capture_output=True)
-            subprocess.run('net start bits', shell=True, capture_output=True)
-            subprocess.run('net start msiserver', shell=True, capture_output=True)
+                        try:
+                            os.rename(folder, backup_folder)
+                            folder_size = self._get_folder_size(backup_folder)
+                            space_freed += folder_size
+                            files_cleaned += 1
+                        except Exception as e:
+                            self.logger.error(f"Erro ao limpar {folder}: {e}")
+                            
+            finally:
+                # Reinicia serviços mesmo se a limpeza falhar no meio
+                self._run_powershell(
+                    f"Start-Service -Name {WINDOWS_UPDATE_SERVICES} -ErrorAction SilentlyContinue"
+                )
             
             return {
                 "success": True,
@@ -388,107 +620,307 @@ class CleanupEngine:
             self.logger.error(f"Erro na limpeza do Windows Update: {e}")
             return {"success": False, "error": str(e)}
             
+    def _run_powershell(self, command: str) -> subprocess.CompletedProcess:
+        """Executa um comando PowerShell sem perfil e sem passar pelo cmd.exe"""
+        return subprocess.run(
+            ["powershell.exe", "-NoProfile", "-NonInteractive", "-Command", command],
+            capture_output=True,
+            text=True
+        )
+        
+    def _clean_folders_parallel(self, folders: List[str], extensions: Tuple[str, ...] = None,
+                                fast: bool = False) -> Dict[str, Dict[str, any]]:
+        """Limpa várias pastas raiz em paralelo e retorna o resultado de cada uma
+        
+        Com `fast=True` e sem filtro de extensões, o conteúdo de cada pasta é
+        apagado por inteiro via _wipe_tree_fast.
+        """
+        folders = list(dict.fromkeys(folders))
+        results = {}
+        
+        if not folders:
+            return results
+            
+        # Cada árvore é independente: as chamadas de E/S liberam o GIL e se
+        # sobrepõem, até o limite do pool compartilhado
+        if fast and not extensions:
+            futures = {_tree_pool.submit(self._wipe_tree_fast, folder): folder for folder in folders}
+        else:
+            futures = {
+                _tree_pool.submit(self._clean_folder, folder, True, extensions): folder
+                for folder in folders
+            }
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                results[folder] = future.result()
+            except Exception as e:
+                results[folder] = {"files_cleaned": 0, "space_freed": 0,
+                                   "errors": [f"Erro ao limpar {folder}: {e}"]}
+                
+        return results
+        
+    @_no_error_dialogs()
     def _clean_folder(self, folder_path: str, recursive: bool = False, 
                      extensions: List[str] = None) -> Dict[str, any]:
-        """Limpa uma pasta específica"""
+        """Limpa uma pasta específica
+        
+        A thread atual enumera a árvore e envia os arquivos em lotes de
+        UNLINK_BATCH_SIZE ao pool de remoção compartilhado, sobrepondo
+        enumeração e exclusão. Árvores com um único lote são removidas na
+        própria thread. No máximo UNLINK_MAX_PENDING_BATCHES lotes ficam
+        pendentes; acima disso a enumeração espera pelo mais antigo.
+        
+        Com `recursive`, a enumeração registra quantas entradas cada pasta tem e
+        as remoções são contadas por pasta; ao final só recebem os.rmdir as
+        pastas cujo saldo chegou a zero, sem nova listagem.
+        """
         files_cleaned = 0
         space_freed = 0
         errors = []
+        dir_entries = {} if recursive else None
+        removed_per_dir = Counter()
+        extensions = self._normalize_extensions(extensions)
         
+        def collect(batch_result):
+            nonlocal files_cleaned, space_freed
+            batch_files, batch_bytes, batch_errors, batch_removed = batch_result
+            files_cleaned += batch_files
+            space_freed += batch_bytes
+            errors.extend(batch_errors)
+            removed_per_dir.update(batch_removed)
+            
         try:
             if not os.path.exists(folder_path):
                 return {"files_cleaned": 0, "space_freed": 0, "errors": []}
                 
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
+            pending = deque()
+            batch = []
+            try:
+                for entry in self._iter_files(folder_path, dir_entries):
+                    # Verifica extensões se especificadas (antes do stat)
+                    if extensions and not entry.name.lower().endswith(extensions):
+                        continue
+                        
+                    try:
+                        file_size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    batch.append((entry.path, file_size))
+                    if len(batch) >= UNLINK_BATCH_SIZE:
+                        pending.append(_unlink_pool.submit(self._unlink_batch, batch, recursive))
+                        batch = []
+                        if len(pending) >= UNLINK_MAX_PENDING_BATCHES:
+                            collect(pending.popleft().result())
+            finally:
+                # Todo lote enviado é aguardado, mesmo se a enumeração falhar
+                if batch:
+                    if pending:
+                        pending.append(_unlink_pool.submit(self._unlink_batch, batch, recursive))
+                    else:
+                        collect(self._unlink_batch(batch, recursive))
+                while pending:
+                    collect(pending.popleft().result())
                     
-                    # Verifica extensões se especificadas
-                    if extensions:
-                        if not any(file.lower().endswith(ext) for ext in extensions):
-                            continue
-                            
+            # Remove pastas que ficaram vazias (filhas antes das pais; a raiz é mantida)
+            if recursive:
+                root = next(iter(dir_entries), None)
+                for dir_path in reversed(dir_entries):
+                    if dir_path == root or dir_entries[dir_path] != removed_per_dir[dir_path]:
+                        continue
                     try:
-                        # Verifica se o arquivo não está em uso
-                        if self._is_file_in_use(file_path):
-                            continue
-                            
-                        file_size = os.path.getsize(file_path)
-                        os.remove(file_path)
-                        files_cleaned += 1
-                        space_freed += file_size
-                        
-                    except Exception as e:
-                        errors.append(f"Erro ao remover {file_path}: {e}")
+                        _remove_dir(dir_path)
+                        removed_per_dir[os.path.dirname(dir_path)] += 1
+                    except OSError:
+                        pass
                         
-                # Remove pastas vazias se recursivo
-                if recursive:
-                    for dir_name in dirs:
-                        dir_path = os.path.join(root, dir_name)
-                        try:
-                            if not os.listdir(dir_path):  # Pasta vazia
-                                os.rmdir(dir_path)
-                        except:
-                            pass
-                            
-        except Exception as e:
+        except OSError as e:
             errors.append(f"Erro ao acessar pasta {folder_path}: {e}")
             
+        self._invalidate_preview_cache(folder_path)
+        
         return {
             "files_cleaned": files_cleaned,
             "space_freed": space_freed,
             "errors": errors
         }
         
-    def _is_file_in_use(self, file_path: str) -> bool:
-        """Verifica se um arquivo está em uso"""
+    @staticmethod
+    def _normalize_extensions(extensions) -> Optional[Tuple[str, ...]]:
+        """Converte o filtro de extensões em tupla minúscula (aceita por str.endswith)"""
+        if not extensions:
+            return None
+        return tuple(ext.lower() for ext in extensions)
+        
+    @_no_error_dialogs()
+    def _unlink_batch(self, items: List[Tuple[str, int]],
+                      track_dirs: bool = False) -> Tuple[int, int, List[str], Counter]:
+        """Remove cada (caminho, tamanho) do lote
+        
+        Com `track_dirs`, também conta os arquivos removidos por pasta.
+        """
+        files_cleaned = 0
+        space_freed = 0
+        errors = []
+        removed_per_dir = Counter()
+        
+        for file_path, file_size in items:
+            try:
+                _remove_file(file_path)
+                files_cleaned += 1
+                space_freed += file_size
+                if track_dirs:
+                    removed_per_dir[os.path.dirname(file_path)] += 1
+            except FileNotFoundError:
+                # Já removido por outro processo de limpeza entre a listagem e a remoção
+                continue
+            except PermissionError:
+                # Arquivo em uso: o próprio remove falha, sem sondagem prévia
+                continue
+            except OSError as e:
+                # Só os erros inesperados viram mensagem (sem log por arquivo)
+                errors.append(f"Erro ao remover {file_path} (errno {e.errno}): {e.strerror}")
+                
+        return files_cleaned, space_freed, errors, removed_per_dir
+        
+    @_no_error_dialogs()
+    def _wipe_tree_fast(self, folder_path: str) -> Dict[str, any]:
+        """Apaga todo o conteúdo de uma pasta, mantendo a pasta raiz
+        
+        Sem filtro de extensões não há decisão por arquivo: cada filha da raiz
+        é removida com shutil.rmtree (pastas) ou _remove_file (arquivos). A
+        contagem vem de uma varredura nova (_get_folder_info, nunca o cache do
+        preview) e o que falhar na remoção é descontado dela, sem nova listagem.
+        Arquivos somente leitura ou em uso são mantidos e reportados, como em
+        _clean_folder.
+        """
+        before = self._get_folder_info(folder_path)
+        errors = []
+        kept_files = 0
+        kept_bytes = 0
+        denied = 0
+        
+        def on_error(func, path, exc):
+            nonlocal kept_files, kept_bytes, denied
+            if isinstance(exc, tuple):
+                exc = exc[1]  # onerror (Python < 3.12) recebe sys.exc_info()
+            # Já removido, ou pasta que manteve arquivos que falharam
+            if isinstance(exc, FileNotFoundError) or func in (os.rmdir, _remove_dir):
+                return
+            if func in (os.unlink, os.remove, _remove_file):
+                kept_files += 1
+                try:
+                    kept_bytes += os.lstat(path).st_size
+                except OSError:
+                    pass
+            if isinstance(exc, PermissionError):
+                denied += 1
+            else:
+                errors.append(f"Erro ao remover {path} (errno {exc.errno}): {exc.strerror}")
+                
         try:
-            with open(file_path, 'r+b'):
-                return False
-        except IOError:
-            return True
+            with os.scandir(folder_path) as it:
+                children = list(it)
+        except OSError as e:
+            return {"files_cleaned": 0, "space_freed": 0,
+                    "errors": [f"Erro ao acessar pasta {folder_path}: {e}"]}
+                    
+        is_junction = getattr(os.DirEntry, 'is_junction', None)
+        for entry in children:
+            try:
+                if entry.is_symlink() or (is_junction and entry.is_junction()):
+                    # Link: remove só o link, nunca o destino (no Windows, link
+                    # de pasta sai com RemoveDirectoryW)
+                    if os.name == 'nt' and entry.is_dir():
+                        _remove_dir(entry.path)
+                    else:
+                        _remove_file(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, **{RMTREE_ERROR_KW: on_error})
+                else:
+                    _remove_file(entry.path)
+            except OSError as e:
+                on_error(_remove_file, entry.path, e)
+                
+        if denied:
+            errors.append(f"{denied} item(ns) em uso ou sem permissão mantido(s) em {folder_path}")
             
+        self._invalidate_preview_cache(folder_path)
+        
+        return {
+            "files_cleaned": max(0, before["file_count"] - kept_files),
+            "space_freed": max(0, before["size"] - kept_bytes),
+            "errors": errors
+        }
+        
+    def _iter_files(self, folder_path: str, dir_entries: Optional[Dict[str, int]] = None):
+        """Percorre uma pasta com os.scandir retornando os arquivos como DirEntry.
+        
+        O DirEntry já traz nome, caminho e (no Windows) o stat do arquivo, evitando
+        os.path.join e chamadas extras de os.path.getsize. Se `dir_entries` for
+        informado, recebe {pasta: quantidade de entradas} na ordem de visita
+        (toda pasta aparece depois da pasta pai). O caminho raiz é normalizado
+        para que os.path.dirname de cada entrada coincida com a chave da pasta.
+        """
+        pending = [os.path.normpath(folder_path)]
+        
+        while pending:
+            current = pending.pop()
+            count = 0
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        count += 1
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry
+                        except OSError:
+                            continue
+            except OSError:
+                # Pasta ilegível: sem contagem confiável, nunca é removida
+                count = -1
+            if dir_entries is not None:
+                dir_entries[current] = count
+                
     def _identify_browser(self, cache_path: str) -> str:
         """Identifica o navegador pelo caminho do cache"""
-        cache_path_lower = cache_path.lower()
-        
-        if 'chrome' in cache_path_lower:
-            return 'Google Chrome'
-        elif 'firefox' in cache_path_lower:
-            return 'Mozilla Firefox'
-        elif 'edge' in cache_path_lower:
-            return 'Microsoft Edge'
-        elif 'opera' in cache_path_lower:
-            return 'Opera'
-        elif 'brave' in cache_path_lower:
-            return 'Brave'
-        else:
-            return 'Navegador Desconhecido'
-            
-    def _clean_firefox_cache(self):
-        """Limpeza específica do Firefox"""
-        try:
-            profiles_path = os.path.join(os.environ.get('APPDATA', ''), 'Mozilla', 'Firefox', 'Profiles')
-            
-            if os.path.exists(profiles_path):
-                for profile in os.listdir(profiles_path):
-                    profile_path = os.path.join(profiles_path, profile)
-                    if os.path.isdir(profile_path):
-                        # Cache folders específicos do Firefox
-                        cache_folders = ['cache2', 'startupCache', 'OfflineCache']
-                        
-                        for cache_folder in cache_folders:
-                            cache_path = os.path.join(profile_path, cache_folder)
-                            if os.path.exists(cache_path):
-                                self._clean_folder(cache_path, recursive=True)
-                                
-        except Exception as e:
-            self.logger.error(f"Erro na limpeza do Firefox: {e}")
+        return self._browser_by_path.get(cache_path, 'Navegador Desconhecido')
             
+    @_no_error_dialogs()
+    def _firefox_cache_folders(self) -> List[str]:
+        """Lista as pastas de cache (cache2, startupCache, OfflineCache) de cada perfil do Firefox
+        
+        A pasta Profiles em si não é limpa: no AppData\\Roaming ela guarda
+        favoritos, senhas e demais dados do usuário.
+        """
+        folders = []
+        
+        for profiles_path in _existing_paths(self._firefox_profile_roots):
+            try:
+                with os.scandir(profiles_path) as it:
+                    for profile in it:
+                        if not profile.is_dir(follow_symlinks=False):
+                            continue
+                        for cache_folder in FIREFOX_CACHE_SUBFOLDERS:
+                            cache_path = os.path.join(profile.path, cache_folder)
+                            if os.path.isdir(cache_path):
+                                folders.append(cache_path)
+                                # Caminho dinâmico: registra para _identify_browser
+                                self._browser_by_path.setdefault(cache_path, 'Mozilla Firefox')
+            except OSError as e:
+                self.logger.error(f"Erro ao listar perfis do Firefox em {profiles_path}: {e}")
+                
+        return folders
+        
     def _flush_dns_cache(self):
         """Limpa cache DNS"""
         try:
-            subprocess.run('ipconfig /flushdns', shell=True, capture_output=True)
+            # Mesma API usada pelo ipconfig /flushdns, sem criar processos;
+            # o ipconfig fica só como alternativa se a API falhar
+            if not flush_dns_cache():
+                subprocess.run('ipconfig /flushdns', shell=True, capture_output=True)
         except Exception as e:
             self.logger.error(f"Erro ao limpar cache DNS: {e}")
             
@@ -505,30 +937,31 @@ class CleanupEngine:
             # Lista de logs seguros para limpar
             safe_logs = ['Application', 'System', 'Security', 'Setup']
             
-            for log_name in safe_logs:
-                cmd = f'wevtutil cl {log_name}'
-                subprocess.run(cmd, shell=True, capture_output=True)
+            # Os logs são independentes: limpa todos ao mesmo tempo, sem cmd.exe
+            with ThreadPoolExecutor(max_workers=len(safe_logs),
+                                    thread_name_prefix="FPSPackEventLog") as executor:
+                list(executor.map(
+                    lambda log_name: subprocess.run(['wevtutil', 'cl', log_name], capture_output=True),
+                    safe_logs
+                ))
                 
         except Exception as e:
             self.logger.error(f"Erro ao limpar Event Logs: {e}")
             
     def _clean_registry_key(self, hkey, subkey: str) -> int:
-        """Limpa uma chave específica do registro"""
+        """Limpa uma chave específica do registro
+        
+        Remove apenas os valores da chave; subchaves são preservadas. A
+        quantidade de valores vem de QueryInfoKey, sem enumerar até o erro.
+        """
         keys_cleaned = 0
         
         try:
             with winreg.OpenKey(hkey, subkey, 0, winreg.KEY_ALL_ACCESS) as key:
-                # Lista todos os valores
-                i = 0
-                values_to_delete = []
+                _, value_count, _ = winreg.QueryInfoKey(key)
                 
-                while True:
-                    try:
-                        value_name, _, _ = winreg.EnumValue(key, i)
-                        values_to_delete.append(value_name)
-                        i += 1
-                    except WindowsError:
-                        break
+                # Lista todos os valores (quantidade já conhecida)
+                values_to_delete = [winreg.EnumValue(key, i)[0] for i in range(value_count)]
                         
                 # Remove valores
                 for value_name in values_to_delete:
@@ -550,33 +983,41 @@ class CleanupEngine:
         
     def _get_recycle_bin_size(self) -> int:
         """Obtém tamanho da lixeira"""
+        return self._query_recycle_bin()[0]
+        
+    def _query_recycle_bin(self) -> Tuple[int, int]:
+        """Retorna (tamanho em bytes, quantidade de itens) da lixeira de todas as unidades
+        
+        SHQueryRecycleBinW lê os totais que o Windows já mantém para a lixeira,
+        sem percorrer C:\\$Recycle.Bin (que também inclui pastas de outros usuários).
+        """
         try:
-            # Caminho da lixeira
-            recycle_bin_path = r'C:\$Recycle.Bin'
-            
-            if os.path.exists(recycle_bin_path):
-                return self._get_folder_size(recycle_bin_path)
-            else:
-                return 0
+            if _shell32 is None:
+                return 0, 0
                 
+            info = SHQUERYRBINFO()
+            info.cbSize = ctypes.sizeof(SHQUERYRBINFO)
+            hresult = _SHQueryRecycleBinW(None, ctypes.byref(info))
+            if hresult != 0:
+                self.logger.warning(f"SHQueryRecycleBinW falhou: HRESULT 0x{hresult & 0xFFFFFFFF:08X}")
+                return 0, 0
+                
+            return info.i64Size, info.i64NumItems
+            
         except Exception as e:
             self.logger.error(f"Erro ao obter tamanho da lixeira: {e}")
-            return 0
+            return 0, 0
             
+    @_no_error_dialogs()
     def _get_folder_size(self, folder_path: str) -> int:
         """Calcula tamanho total de uma pasta"""
         total_size = 0
         
         try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(file_path)
-                    except (OSError, IOError):
-                        continue
-                        
-        except Exception as e:
+            for _, size in self._iter_file_sizes(folder_path):
+                total_size += size
+                
+        except OSError as e:
             self.logger.error(f"Erro ao calcular tamanho da pasta {folder_path}: {e}")
             
         return total_size
@@ -616,10 +1057,9 @@ class CleanupEngine:
         total_size = 0
         
         for temp_folder in self.temp_folders:
-            if temp_folder and os.path.exists(temp_folder):
-                folder_info = self._get_folder_info(temp_folder)
-                file_count += folder_info["file_count"]
-                total_size += folder_info["size"]
+            folder_info = self._get_cached_folder_info(temp_folder)
+            file_count += folder_info["file_count"]
+            total_size += folder_info["size"]
                 
         return {
             "file_count": file_count,
@@ -632,14 +1072,13 @@ class CleanupEngine:
         total_size = 0
         
         for cache_folder in self.cache_folders:
-            if cache_folder and os.path.exists(cache_folder):
-                if os.path.isfile(cache_folder):
-                    file_count += 1
-                    total_size += os.path.getsize(cache_folder)
-                else:
-                    folder_info = self._get_folder_info(cache_folder)
-                    file_count += folder_info["file_count"]
-                    total_size += folder_info["size"]
+            if os.path.isfile(cache_folder):
+                file_count += 1
+                total_size += os.path.getsize(cache_folder)
+            else:
+                folder_info = self._get_cached_folder_info(cache_folder)
+                file_count += folder_info["file_count"]
+                total_size += folder_info["size"]
                     
         return {
             "file_count": file_count,
@@ -652,15 +1091,14 @@ class CleanupEngine:
         total_size = 0
         browsers = []
         
-        for cache_folder in self.browser_cache_folders:
-            if cache_folder and os.path.exists(cache_folder):
-                browser_name = self._identify_browser(cache_folder)
-                if browser_name not in browsers:
-                    browsers.append(browser_name)
-                    
-                folder_info = self._get_folder_info(cache_folder)
-                file_count += folder_info["file_count"]
-                total_size += folder_info["size"]
+        for cache_folder in list(self.browser_cache_folders) + self._firefox_cache_folders():
+            browser_name = self._identify_browser(cache_folder)
+            if browser_name not in browsers:
+                browsers.append(browser_name)
+                
+            folder_info = self._get_cached_folder_info(cache_folder)
+            file_count += folder_info["file_count"]
+            total_size += folder_info["size"]
                 
         return {
             "file_count": file_count,
@@ -674,14 +1112,13 @@ class CleanupEngine:
         total_size = 0
         
         for log_folder in self.log_folders:
-            if log_folder and os.path.exists(log_folder):
-                if os.path.isfile(log_folder):
-                    file_count += 1
-                    total_size += os.path.getsize(log_folder)
-                else:
-                    folder_info = self._get_folder_info(log_folder, extensions=['.log', '.dmp', '.tmp'])
-                    file_count += folder_info["file_count"]
-                    total_size += folder_info["size"]
+            if os.path.isfile(log_folder):
+                file_count += 1
+                total_size += os.path.getsize(log_folder)
+            else:
+                folder_info = self._get_cached_folder_info(log_folder, extensions=LOG_EXTENSIONS)
+                file_count += folder_info["file_count"]
+                total_size += folder_info["size"]
                     
         return {
             "file_count": file_count,
@@ -690,36 +1127,107 @@ class CleanupEngine:
         
     def _preview_recycle_bin(self) -> Dict[str, any]:
         """Preview da lixeira"""
-        size = self._get_recycle_bin_size()
+        size, item_count = self._query_recycle_bin()
         
         return {
-            "file_count": 1 if size > 0 else 0,
+            "file_count": item_count,
             "size_mb": size / (1024 * 1024)
         }
         
+    def _get_cached_folder_info(self, folder_path: str, extensions: List[str] = None) -> Dict[str, any]:
+        """_get_folder_info com cache para o preview
+        
+        Reaproveita a última varredura por até PREVIEW_CACHE_TTL segundos,
+        desde que o mtime da pasta não tenha mudado. A limpeza invalida a
+        entrada da pasta (ver _invalidate_preview_cache).
+        """
+        key = (folder_path, self._normalize_extensions(extensions))
+        try:
+            mtime = os.stat(folder_path).st_mtime
+        except OSError:
+            mtime = 0.0
+            
+        now = time.monotonic()
+        with self._preview_cache_lock:
+            cached = self._preview_cache.get(key)
+        if cached and now - cached[0] < PREVIEW_CACHE_TTL and cached[1] == mtime:
+            return dict(cached[2])
+            
+        result = self._get_folder_info(folder_path, extensions)
+        with self._preview_cache_lock:
+            self._preview_cache[key] = (now, mtime, result)
+        return dict(result)
+        
+    def _invalidate_preview_cache(self, folder_path: Optional[str] = None):
+        """Descarta o preview em cache de uma pasta (ou de todas)"""
+        with self._preview_cache_lock:
+            if folder_path is None:
+                self._preview_cache.clear()
+            else:
+                for key in [k for k in self._preview_cache if k[0] == folder_path]:
+                    del self._preview_cache[key]
+                    
+    @_no_error_dialogs()
     def _get_folder_info(self, folder_path: str, extensions: List[str] = None) -> Dict[str, any]:
         """Obtém informações de uma pasta"""
         file_count = 0
         total_size = 0
+        extensions = self._normalize_extensions(extensions)
         
         try:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if extensions:
-                        if not any(file.lower().endswith(ext) for ext in extensions):
-                            continue
-                            
-                    file_path = os.path.join(root, file)
-                    try:
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
-                    except (OSError, IOError):
-                        continue
-                        
-        except Exception as e:
+            for name, size in self._iter_file_sizes(folder_path):
+                if extensions and not name.lower().endswith(extensions):
+                    continue
+                    
+                total_size += size
+                file_count += 1
+                
+        except OSError as e:
             self.logger.error(f"Erro ao obter informações da pasta {folder_path}: {e}")
             
         return {
             "file_count": file_count,
             "size": total_size
-        }
\ No newline at end of file
+        }
+        
+    def _iter_file_sizes(self, folder_path: str):
+        """Percorre uma pasta retornando (nome, tamanho) de cada arquivo
+        
+        No Windows usa FindFirstFileExW com FindExInfoBasic (sem nome 8.3) e
+        FIND_FIRST_EX_LARGE_FETCH, que devolve lotes maiores por chamada e já
+        traz o tamanho do arquivo. Nos demais sistemas usa _iter_files.
+        """
+        if _kernel32 is None:
+            for entry in self._iter_files(folder_path):
+                try:
+                    yield entry.name, entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+            return
+            
+        data = wintypes.WIN32_FIND_DATAW()
+        pending = [folder_path]
+        
+        while pending:
+            current = pending.pop()
+            handle = _FindFirstFileExW(os.path.join(current, '*'), FIND_EX_INFO_BASIC,
+                                       ctypes.byref(data), FIND_EX_SEARCH_NAME_MATCH,
+                                       None, FIND_FIRST_EX_LARGE_FETCH)
+            if not handle or handle == INVALID_HANDLE_VALUE:
+                continue
+                
+            try:
+                while True:
+                    name = data.cFileName
+                    attributes = data.dwFileAttributes
+                    if attributes & FILE_ATTRIBUTE_DIRECTORY:
+                        # Não segue junções/links simbólicos, como o walker em Python
+                        if name not in ('.', '..') and not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                            pending.append(os.path.join(current, name))
+                    else:
+                        yield name, (data.nFileSizeHigh << 32) | data.nFileSizeLow
+                        
+                    if not _FindNextFileW(handle, ctypes.byref(data)):
+                        break
+            finally:
+                _FindClose(handle)
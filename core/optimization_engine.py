@@ -3,9 +3,17 @@
 """
 Núcleo de Otimização do FPSPACK PANEL
 Funcionalidades reais de otimização de performance
+
+O custo deste módulo está em transições de kernel (processos, serviços,
+registro, memória) e na criação de processos auxiliares, não em cálculo.
+Ganhos vêm de chamar a API do Windows direto em vez de um executável e de
+agrupar N chamadas em uma (NtSetSystemInformation, uma conexão com o SCM,
+netsh -f, PowerWriteACValueIndex); novas operações devem seguir o mesmo padrão.
 """
 
 import os
+import gc
+import re
 import sys
 import time
 import psutil
@@ -14,10 +22,318 @@ import winreg
 import ctypes
 from ctypes import wintypes
 import threading
+import tempfile
+import uuid
+from types import MappingProxyType
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
 from utils.logger import Logger
 from utils.config import Config
-from utils.system_integration import create_restore_point, create_settings_backup, is_admin
+from utils.system_integration import create_restore_point, create_settings_backup, flush_dns_cache, is_admin
+
+# Programas seguros para desabilitar na inicialização
+SAFE_TO_DISABLE_STARTUP = (
+    'spotify', 'discord', 'steam', 'epic', 'origin',
+    'skype', 'zoom', 'teams', 'slack', 'adobe',
+    'office', 'onedrive', 'dropbox', 'googledrive'
+)
+
+# Mesma lista em uma única alternância: a busca roda no motor de regex em C
+SAFE_TO_DISABLE_STARTUP_RE = re.compile('|'.join(map(re.escape, SAFE_TO_DISABLE_STARTUP)), re.IGNORECASE)
+
+# GUIDs dos aliases do powercfg usados no plano otimizado (PowerWriteACValueIndex
+# recebe GUIDs, não aliases)
+POWER_SETTING_GUIDS = {
+    'SUB_PROCESSOR': '54533251-82be-4824-96c1-47b60b740d00',
+    'PROCTHROTTLEMIN': '893dee8e-2bef-41e0-89c6-b55d0929964c',
+    'PROCTHROTTLEMAX': 'bc5038f7-23e0-4960-96da-33abaf5935ec',
+    'PERFBOOSTMODE': 'be337238-0d82-4146-a960-4f3749d470c7',
+    'SUB_SLEEP': '238c9fa8-0aad-41ed-83f4-97be242c8f20',
+    'STANDBYIDLE': '29f6c1db-86da-48c5-9fdb-f2b67b1f44da',
+    'HIBERNATEIDLE': '9d7815a6-7ee4-497e-8888-515a05f02364',
+    'SUB_VIDEO': '7516b95f-f776-4464-8c53-06167f40cc99',
+    'VIDEOIDLE': '3c0bc021-c8a8-4e07-a973-6b14cbcb2b7e',
+    'SUB_DISK': '0012ee47-9041-4b5d-9b77-535fba8b1442',
+    'DISKIDLE': '6738e2c4-e8a5-4a42-b16a-e040e769756e',
+}
+
+# Limpeza automática de RAM: só roda com uso acima do limite (%) mantido por
+# RAM_PRESSURE_HOLD segundos (o limite padrão vale sem optimization.ram_threshold)
+RAM_PRESSURE_THRESHOLD = 75.0
+RAM_PRESSURE_HOLD = 30.0
+
+# Processos auxiliares sem cmd.exe e sem janela de console
+CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# GUID impresso pelo powercfg -duplicatescheme
+PLAN_GUID_RE = re.compile(r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})')
+
+# Rota padrão no "route PRINT 0.0.0.0": destino, máscara, gateway, interface e métrica
+DEFAULT_ROUTE_RE = re.compile(r"0\.0\.0\.0\s+0\.0\.0\.0\s+[0-9.]+\.[0-9.]+\s+[0-9.]+\s+(\d+)")
+
+# NtSetSystemInformation(SystemMemoryListInformation, comando): a mesma primitiva
+# usada pelo RAMMap para esvaziar working sets e listas de standby do sistema todo
+SYSTEM_MEMORY_LIST_INFORMATION = 80
+MEMORY_EMPTY_WORKING_SETS = 2
+MEMORY_PURGE_STANDBY_LIST = 4
+MEMORY_PURGE_LOW_PRIORITY_STANDBY_LIST = 5
+
+# Privilégio exigido pelos comandos de SystemMemoryListInformation
+SE_PROF_SINGLE_PROCESS_NAME = "SeProfileSingleProcessPrivilege"
+SE_PRIVILEGE_ENABLED = 0x2
+TOKEN_ADJUST_PRIVILEGES = 0x20
+TOKEN_QUERY = 0x8
+
+# Acesso mínimo exigido por EmptyWorkingSet (abre mais processos que PROCESS_ALL_ACCESS)
+PROCESS_SET_QUOTA = 0x0100
+PROCESS_QUERY_INFORMATION = 0x0400
+
+# Ajuste de prioridade direto por SetPriorityClass (nome lido do mesmo handle)
+PROCESS_SET_INFORMATION = 0x0200
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+HIGH_PRIORITY_CLASS = 0x80
+
+# Processos cuja prioridade é elevada por _boost_process_priorities
+PRIORITY_BOOST_PROCESSES = frozenset({'dwm.exe', 'explorer.exe', 'winlogon.exe'})
+
+# Capacidade inicial (em PIDs) do buffer de EnumProcesses; dobra se encher
+ENUM_PROCESSES_INITIAL = 4096
+
+# Threads do laço alternativo de EmptyWorkingSet (chamadas bloqueantes, sem GIL)
+EMPTY_WORKING_SET_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Service Control Manager: uma única conexão para configurar e parar os serviços
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_CHANGE_CONFIG = 0x0002
+SERVICE_STOP = 0x0020
+SERVICE_NO_CHANGE = 0xFFFFFFFF
+SERVICE_DEMAND_START = 3
+SERVICE_DISABLED = 4
+SERVICE_CONTROL_STOP = 0x1
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+
+# Estado alvo do painel -> (tipo de início da API, valor de "sc config start=")
+SERVICE_START_TYPES = {
+    "disabled": (SERVICE_DISABLED, "disabled"),
+    "manual": (SERVICE_DEMAND_START, "demand"),
+}
+
+
+# Retrato da memória física em bytes; `cache` é o cache do sistema (inclui standby)
+MemoryStatus = namedtuple('MemoryStatus', 'total available used percent cache')
+
+
+class MEMORYSTATUSEX(ctypes.Structure):
+    """Estrutura preenchida por GlobalMemoryStatusEx"""
+    _fields_ = [
+        ("dwLength", wintypes.DWORD),
+        ("dwMemoryLoad", wintypes.DWORD),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+
+class PERFORMANCE_INFORMATION(ctypes.Structure):
+    """Estrutura preenchida por GetPerformanceInfo (valores de memória em páginas)"""
+    _fields_ = [
+        ("cb", wintypes.DWORD),
+        ("CommitTotal", ctypes.c_size_t),
+        ("CommitLimit", ctypes.c_size_t),
+        ("CommitPeak", ctypes.c_size_t),
+        ("PhysicalTotal", ctypes.c_size_t),
+        ("PhysicalAvailable", ctypes.c_size_t),
+        ("SystemCache", ctypes.c_size_t),
+        ("KernelTotal", ctypes.c_size_t),
+        ("KernelPaged", ctypes.c_size_t),
+        ("KernelNonpaged", ctypes.c_size_t),
+        ("PageSize", ctypes.c_size_t),
+        ("HandleCount", wintypes.DWORD),
+        ("ProcessCount", wintypes.DWORD),
+        ("ThreadCount", wintypes.DWORD),
+    ]
+
+
+class GUID(ctypes.Structure):
+    """GUID no layout do Windows"""
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", wintypes.BYTE * 8),
+    ]
+    
+    @classmethod
+    def from_string(cls, value: str) -> "GUID":
+        """Converte 'xxxxxxxx-xxxx-...' para a estrutura (bytes little-endian)"""
+        return cls.from_buffer_copy(uuid.UUID(value).bytes_le)
+
+
+class LUID(ctypes.Structure):
+    """Identificador local de privilégio"""
+    _fields_ = [
+        ("LowPart", wintypes.DWORD),
+        ("HighPart", wintypes.LONG),
+    ]
+
+
+class SERVICE_STATUS(ctypes.Structure):
+    """Estrutura preenchida por ControlService"""
+    _fields_ = [
+        ("dwServiceType", wintypes.DWORD),
+        ("dwCurrentState", wintypes.DWORD),
+        ("dwControlsAccepted", wintypes.DWORD),
+        ("dwWin32ExitCode", wintypes.DWORD),
+        ("dwServiceSpecificExitCode", wintypes.DWORD),
+        ("dwCheckPoint", wintypes.DWORD),
+        ("dwWaitHint", wintypes.DWORD),
+    ]
+
+
+class TOKEN_PRIVILEGES(ctypes.Structure):
+    """TOKEN_PRIVILEGES com um único LUID_AND_ATTRIBUTES"""
+    _fields_ = [
+        ("PrivilegeCount", wintypes.DWORD),
+        ("Luid", LUID),
+        ("Attributes", wintypes.DWORD),
+    ]
+
+
+if os.name == 'nt':
+    _ntdll = ctypes.WinDLL('ntdll')
+    _NtSetSystemInformation = _ntdll.NtSetSystemInformation
+    _NtSetSystemInformation.argtypes = [wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG]
+    _NtSetSystemInformation.restype = wintypes.LONG
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _GetCurrentProcess = _kernel32.GetCurrentProcess
+    _GetCurrentProcess.argtypes = []
+    _GetCurrentProcess.restype = wintypes.HANDLE
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenProcess.restype = wintypes.HANDLE
+    _SetPriorityClass = _kernel32.SetPriorityClass
+    _SetPriorityClass.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _SetPriorityClass.restype = wintypes.BOOL
+    _GlobalMemoryStatusEx = _kernel32.GlobalMemoryStatusEx
+    _GlobalMemoryStatusEx.argtypes = [ctypes.POINTER(MEMORYSTATUSEX)]
+    _GlobalMemoryStatusEx.restype = wintypes.BOOL
+
+    _psapi = ctypes.WinDLL('psapi', use_last_error=True)
+    _EmptyWorkingSet = _psapi.EmptyWorkingSet
+    _EmptyWorkingSet.argtypes = [wintypes.HANDLE]
+    _EmptyWorkingSet.restype = wintypes.BOOL
+    _EnumProcesses = _psapi.EnumProcesses
+    _EnumProcesses.argtypes = [ctypes.POINTER(wintypes.DWORD), wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+    _EnumProcesses.restype = wintypes.BOOL
+    _GetProcessImageFileNameW = _psapi.GetProcessImageFileNameW
+    _GetProcessImageFileNameW.argtypes = [wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD]
+    _GetProcessImageFileNameW.restype = wintypes.DWORD
+    _GetPerformanceInfo = _psapi.GetPerformanceInfo
+    _GetPerformanceInfo.argtypes = [ctypes.POINTER(PERFORMANCE_INFORMATION), wintypes.DWORD]
+    _GetPerformanceInfo.restype = wintypes.BOOL
+
+    _advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    _OpenProcessToken = _advapi32.OpenProcessToken
+    _OpenProcessToken.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)]
+    _OpenProcessToken.restype = wintypes.BOOL
+    _LookupPrivilegeValueW = _advapi32.LookupPrivilegeValueW
+    _LookupPrivilegeValueW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(LUID)]
+    _LookupPrivilegeValueW.restype = wintypes.BOOL
+    _AdjustTokenPrivileges = _advapi32.AdjustTokenPrivileges
+    _AdjustTokenPrivileges.argtypes = [wintypes.HANDLE, wintypes.BOOL, ctypes.POINTER(TOKEN_PRIVILEGES),
+                                       wintypes.DWORD, ctypes.c_void_p, ctypes.c_void_p]
+    _AdjustTokenPrivileges.restype = wintypes.BOOL
+    _OpenSCManagerW = _advapi32.OpenSCManagerW
+    _OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+    _OpenSCManagerW.restype = wintypes.HANDLE
+    _OpenServiceW = _advapi32.OpenServiceW
+    _OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+    _OpenServiceW.restype = wintypes.HANDLE
+    _ChangeServiceConfigW = _advapi32.ChangeServiceConfigW
+    _ChangeServiceConfigW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+                                      wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(wintypes.DWORD),
+                                      wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR]
+    _ChangeServiceConfigW.restype = wintypes.BOOL
+    _ControlService = _advapi32.ControlService
+    _ControlService.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SERVICE_STATUS)]
+    _ControlService.restype = wintypes.BOOL
+    _CloseServiceHandle = _advapi32.CloseServiceHandle
+    _CloseServiceHandle.argtypes = [wintypes.HANDLE]
+    _CloseServiceHandle.restype = wintypes.BOOL
+
+    _powrprof = ctypes.WinDLL('powrprof')
+    _PowerWriteACValueIndex = _powrprof.PowerWriteACValueIndex
+    _PowerWriteACValueIndex.argtypes = [wintypes.HKEY, ctypes.POINTER(GUID), ctypes.POINTER(GUID),
+                                        ctypes.POINTER(GUID), wintypes.DWORD]
+    _PowerWriteACValueIndex.restype = wintypes.DWORD
+    _PowerSetActiveScheme = _powrprof.PowerSetActiveScheme
+    _PowerSetActiveScheme.argtypes = [wintypes.HKEY, ctypes.POINTER(GUID)]
+    _PowerSetActiveScheme.restype = wintypes.DWORD
+else:  # pragma: no cover - Non Windows fallback
+    _ntdll = None
+    _kernel32 = None
+    _psapi = None
+    _advapi32 = None
+    _powrprof = None
+
+
+# Perfis de otimização (somente leitura, compartilhados entre instâncias)
+OPTIMIZATION_PROFILES = MappingProxyType({
+    "gamer": {
+        "name": "Modo Gamer",
+        "description": "Otimizações focadas em jogos",
+        "settings": {
+            "ram_cleanup": True,
+            "process_priority": "high",
+            "power_plan": "ultimate_performance",
+            "network_optimization": True,
+            "disable_services": ["superfetch", "sysmain", "themes"],
+            "cpu_priority": "realtime"
+        }
+    },
+    "balanced": {
+        "name": "Modo Equilibrado",
+        "description": "Balance entre performance e estabilidade",
+        "settings": {
+            "ram_cleanup": True,
+            "process_priority": "above_normal",
+            "power_plan": "high_performance",
+            "network_optimization": False,
+            "disable_services": ["superfetch"],
+            "cpu_priority": "high"
+        }
+    },
+    "maximum": {
+        "name": "Máximo Desempenho",
+        "description": "Todas as otimizações ativadas",
+        "settings": {
+            "ram_cleanup": True,
+            "process_priority": "realtime",
+            "power_plan": "ultimate_performance",
+            "network_optimization": True,
+            "disable_services": ["superfetch", "sysmain", "themes", "spooler", "fax"],
+            "cpu_priority": "realtime",
+            "disable_visual_effects": True,
+            "optimize_startup": True
+        }
+    }
+})
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    """Executa um comando (lista de argumentos, sem shell) capturando a saída"""
+    return subprocess.run(args, capture_output=True, text=True, errors='replace',
+                          creationflags=CREATE_NO_WINDOW)
+
 
 class OptimizationEngine:
     def __init__(self):
@@ -25,72 +341,52 @@ class OptimizationEngine:
         self.config = Config()
         self.is_admin = self._check_admin_privileges()
         self.optimization_active = False
+        # Protege só as mudanças de estado do Modo Turbo (nunca é mantido
+        # durante as etapas da ativação)
+        self._turbo_lock = threading.Lock()
+        self._turbo_activating = False
         self._last_checkpoint_label: Optional[str] = None
+        self._memory_privilege_enabled: Optional[bool] = None
+        self._last_pressure_time = 0.0
+        # GUID do plano "FPSPACK Performance Mode" criado nesta sessão
+        self._turbo_plan_guid: Optional[str] = None
         
         # Configurações de otimização
-        self.optimization_profiles = {
-            "gamer": {
-                "name": "Modo Gamer",
-                "description": "Otimizações focadas em jogos",
-                "settings": {
-                    "ram_cleanup": True,
-                    "process_priority": "high",
-                    "power_plan": "ultimate_performance",
-                    "network_optimization": True,
-                    "disable_services": ["superfetch", "sysmain", "themes"],
-                    "cpu_priority": "realtime"
-                }
-            },
-            "balanced": {
-                "name": "Modo Equilibrado",
-                "description": "Balance entre performance e estabilidade",
-                "settings": {
-                    "ram_cleanup": True,
-                    "process_priority": "above_normal",
-                    "power_plan": "high_performance",
-                    "network_optimization": False,
-                    "disable_services": ["superfetch"],
-                    "cpu_priority": "high"
-                }
-            },
-            "maximum": {
-                "name": "Máximo Desempenho",
-                "description": "Todas as otimizações ativadas",
-                "settings": {
-                    "ram_cleanup": True,
-                    "process_priority": "realtime",
-                    "power_plan": "ultimate_performance",
-                    "network_optimization": True,
-                    "disable_services": ["superfetch", "sysmain", "themes", "spooler", "fax"],
-                    "cpu_priority": "realtime",
-                    "disable_visual_effects": True,
-                    "optimize_startup": True
-                }
-            }
-        }
+        self.optimization_profiles = OPTIMIZATION_PROFILES
         
     def _check_admin_privileges(self) -> bool:
         """Verifica se esta executando como administrador"""
         return is_admin()
 
     def ensure_safety_checkpoint(self, reason: str, include_restore_point: bool = True, include_backup: bool = True) -> Dict[str, Dict[str, Optional[str]]]:
-        """Cria salvaguardas antes de aplicar otimizacoes que alteram o sistema."""
+        """Cria salvaguardas antes de aplicar otimizacoes que alteram o sistema.
+
+        O ponto de restauracao e o backup sao independentes e rodam em paralelo;
+        a espera total e a da operacao mais lenta.
+        """
         results: Dict[str, Dict[str, Optional[str]]] = {}
         label = reason.strip() or "Acao nao especificada"
         self._last_checkpoint_label = label
 
-        if include_restore_point and self.config.get("advanced.create_restore_points", True):
-            description = f"FPSPACK PANEL - {label}"
-            success, message = create_restore_point(description)
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="FPSPackCheckpoint") as executor:
+            restore_future = None
+            backup_future = None
+            if include_restore_point and self.config.get("advanced.create_restore_points", True):
+                restore_future = executor.submit(create_restore_point, f"FPSPACK PANEL - {label}")
+            if include_backup and self.config.get("security.create_backups", True):
+                backup_dir = self.config.get("security.backup_location", "") or None
+                backup_future = executor.submit(create_settings_backup, backup_dir)
+
+        if restore_future is not None:
+            success, message = restore_future.result()
             results["restore_point"] = {"success": "1" if success else "0", "message": message}
             if success:
                 self.logger.info(message)
             else:
                 self.logger.warning(f"Restore point nao criado: {message}")
 
-        if include_backup and self.config.get("security.create_backups", True):
-            backup_dir = self.config.get("security.backup_location", "") or None
-            success, backup_path, message = create_settings_backup(backup_dir)
+        if backup_future is not None:
+            success, backup_path, message = backup_future.result()
             results["backup"] = {"success": "1" if success else "0", "path": str(backup_path) if backup_path else None, "message": message}
             if success and backup_path:
                 self.logger.info(f"Backup criado em: {backup_path}")
@@ -109,13 +405,22 @@ class OptimizationEngine:
             "error": f"A operação '{action}' requer privilégios de administrador. Execute o FPSPACK como administrador e tente novamente.",
             "code": "admin_required"
         }
-    def clean_ram(self) -> Dict[str, any]:
-        """Limpeza inteligente de RAM"""
+    def clean_ram(self, only_under_pressure: bool = False) -> Dict[str, any]:
+        """Limpeza inteligente de RAM
+        
+        Args:
+            only_under_pressure: para chamadas periódicas; pula a limpeza (com
+                "skipped": True) enquanto o uso de RAM não ficar acima de
+                optimization.ram_threshold por RAM_PRESSURE_HOLD segundos
+        """
         try:
-            self.logger.info("Iniciando limpeza de RAM...")
-            
             # Informações antes da limpeza
-            memory_before = psutil.virtual_memory()
+            memory_before = self._memstatus()
+            
+            if only_under_pressure and not self._memory_pressure_sustained(memory_before.percent):
+                return {"success": True, "skipped": True, "memory_percent": memory_before.percent}
+                
+            self.logger.info("Iniciando limpeza de RAM...")
             # 1. EmptyWorkingSet para todos os processos (exige admin)
             if self.is_admin:
                 freed_memory = self._empty_working_sets()
@@ -134,7 +439,7 @@ class OptimizationEngine:
             self._trigger_garbage_collection()
             
             # Informações após a limpeza
-            memory_after = psutil.virtual_memory()
+            memory_after = self._memstatus()
             
             total_freed = memory_before.used - memory_after.used
             
@@ -155,77 +460,195 @@ class OptimizationEngine:
             self.logger.error(f"Erro na limpeza de RAM: {e}")
             return {"success": False, "error": str(e)}
             
-    def _empty_working_sets(self) -> int:
-        """Esvazia working sets dos processos"""
-        freed_memory = 0
+    def _memory_pressure_sustained(self, percent: float) -> bool:
+        """True quando o uso de RAM está acima do limite há RAM_PRESSURE_HOLD segundos"""
+        now = time.monotonic()
+        if percent < self.config.get("optimization.ram_threshold", RAM_PRESSURE_THRESHOLD):
+            self._last_pressure_time = 0.0
+            return False
+            
+        if not self._last_pressure_time:
+            self._last_pressure_time = now
+            return False
+            
+        if now - self._last_pressure_time < RAM_PRESSURE_HOLD:
+            return False
+            
+        # Uma limpeza por período de pressão: o próximo gatilho espera de novo
+        self._last_pressure_time = 0.0
+        return True
         
-        try:
-            # Importa APIs do Windows
-            kernel32 = ctypes.windll.kernel32
-            psapi = ctypes.windll.psapi
+    def _enable_memory_privilege(self) -> bool:
+        """Habilita SeProfileSingleProcessPrivilege no token do processo (uma vez)"""
+        if self._memory_privilege_enabled is not None:
+            return self._memory_privilege_enabled
             
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    # Abre handle do processo
-                    handle = kernel32.OpenProcess(0x1F0FFF, False, proc.info['pid'])
-                    if handle:
-                        # EmptyWorkingSet
-                        if psapi.EmptyWorkingSet(handle):
-                            freed_memory += 1
-                        kernel32.CloseHandle(handle)
+        enabled = False
+        try:
+            if _advapi32 is not None:
+                token = wintypes.HANDLE()
+                if _OpenProcessToken(_GetCurrentProcess(), TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY,
+                                     ctypes.byref(token)):
+                    try:
+                        privileges = TOKEN_PRIVILEGES()
+                        privileges.PrivilegeCount = 1
+                        privileges.Attributes = SE_PRIVILEGE_ENABLED
+                        if _LookupPrivilegeValueW(None, SE_PROF_SINGLE_PROCESS_NAME,
+                                                  ctypes.byref(privileges.Luid)):
+                            # AdjustTokenPrivileges retorna TRUE mesmo sem atribuir o
+                            # privilégio; ERROR_NOT_ALL_ASSIGNED (1300) indica falha
+                            ok = _AdjustTokenPrivileges(token, False, ctypes.byref(privileges), 0, None, None)
+                            enabled = bool(ok) and ctypes.get_last_error() == 0
+                    finally:
+                        _CloseHandle(token)
                         
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                    
+            if not enabled:
+                self.logger.warning(f"Não foi possível habilitar {SE_PROF_SINGLE_PROCESS_NAME}")
+                
         except Exception as e:
-            self.logger.error(f"Erro no EmptyWorkingSet: {e}")
+            self.logger.error(f"Erro ao habilitar privilégio de memória: {e}")
             
-        return freed_memory
+        self._memory_privilege_enabled = enabled
+        return enabled
         
-    def _clear_standby_cache(self) -> int:
-        """Limpa cache de standby usando RAMMap technique"""
+    def _set_memory_list(self, command: int) -> bool:
+        """Envia um comando de SystemMemoryListInformation ao kernel
+        
+        Args:
+            command: MEMORY_EMPTY_WORKING_SETS, MEMORY_PURGE_STANDBY_LIST ou
+                MEMORY_PURGE_LOW_PRIORITY_STANDBY_LIST
+                
+        Returns:
+            bool: True se o NTSTATUS for 0 (sucesso)
+        """
         try:
-            if not self.is_admin:
-                return 0
+            if _ntdll is None or not self._enable_memory_privilege():
+                return False
                 
-            # Comando para limpar standby cache
-            cmd = 'powershell -Command "& {Get-CimInstance -ClassName Win32_OperatingSystem | Invoke-CimMethod -MethodName SetPrioritySeparation -Arguments @{PrioritySeparation=2}}"'
-            subprocess.run(cmd, shell=True, capture_output=True)
+            value = wintypes.ULONG(command)
+            status = _NtSetSystemInformation(SYSTEM_MEMORY_LIST_INFORMATION,
+                                             ctypes.byref(value), ctypes.sizeof(value))
+            if status != 0:
+                self.logger.warning(f"NtSetSystemInformation({command}) falhou: NTSTATUS 0x{status & 0xFFFFFFFF:08X}")
+                return False
+            return True
             
-            # Limpa cache usando técnica de alocação/liberação
-            return self._force_standby_cleanup()
+        except Exception as e:
+            self.logger.error(f"Erro no NtSetSystemInformation: {e}")
+            return False
             
+    def _empty_working_sets(self) -> int:
+        """Esvazia working sets dos processos
+        
+        Uma única chamada de NtSetSystemInformation esvazia os working sets de
+        todos os processos; o laço por processo fica só como alternativa.
+        
+        Returns:
+            int: quantidade de processos afetados
+        """
+        freed_memory = 0
+        
+        try:
+            if self._set_memory_list(MEMORY_EMPTY_WORKING_SETS):
+                return len(self._enum_process_ids())
+                
+            if _psapi is None:
+                return 0
+                
+            # OpenProcess/EmptyWorkingSet liberam o GIL: os PIDs são tratados em paralelo
+            with ThreadPoolExecutor(max_workers=EMPTY_WORKING_SET_WORKERS,
+                                    thread_name_prefix="FPSPackWorkingSet") as executor:
+                freed_memory = sum(executor.map(self._empty_process_working_set,
+                                                self._enum_process_ids()))
+                    
         except Exception as e:
-            self.logger.error(f"Erro na limpeza de standby: {e}")
-            return 0
+            self.logger.error(f"Erro no EmptyWorkingSet: {e}")
+            
+        return freed_memory
+        
+    @staticmethod
+    def _empty_process_working_set(pid: int) -> bool:
+        """Esvazia o working set de um processo; False se não for possível abri-lo"""
+        # Processos protegidos ou já encerrados retornam NULL (acesso negado é
+        # esperado e não é registrado no log)
+        handle = _OpenProcess(PROCESS_SET_QUOTA | PROCESS_QUERY_INFORMATION, False, pid)
+        if not handle:
+            return False
             
-    def _force_standby_cleanup(self) -> int:
-        """Força limpeza do cache de standby"""
         try:
-            # Técnica de alocação temporária para forçar limpeza
-            available_memory = psutil.virtual_memory().available
-            chunk_size = min(available_memory // 4, 1024 * 1024 * 1024)  # Max 1GB
+            return bool(_EmptyWorkingSet(handle))
+        finally:
+            _CloseHandle(handle)
             
-            # Aloca e libera memória para forçar limpeza do standby
-            temp_data = bytearray(chunk_size)
-            del temp_data
+    def _memstatus(self) -> MemoryStatus:
+        """Lê a memória física com GlobalMemoryStatusEx e GetPerformanceInfo
+        
+        O psutil não expõe o cache do sistema no Windows; fora dele, o
+        retrato vem de psutil.virtual_memory().
+        """
+        if _kernel32 is None:
+            memory = psutil.virtual_memory()
+            return MemoryStatus(memory.total, memory.available, memory.used,
+                                memory.percent, getattr(memory, 'cached', 0))
+                                
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if not _GlobalMemoryStatusEx(ctypes.byref(status)):
+            raise ctypes.WinError(ctypes.get_last_error())
+            
+        performance = PERFORMANCE_INFORMATION()
+        performance.cb = ctypes.sizeof(PERFORMANCE_INFORMATION)
+        cache = 0
+        if _GetPerformanceInfo(ctypes.byref(performance), performance.cb):
+            cache = performance.SystemCache * performance.PageSize
+            
+        total = status.ullTotalPhys
+        available = status.ullAvailPhys
+        used = total - available
+        return MemoryStatus(total, available, used, used / total * 100 if total else 0.0, cache)
+        
+    def _enum_process_ids(self) -> List[int]:
+        """Lista os PIDs com uma chamada de EnumProcesses, sem criar psutil.Process"""
+        if _psapi is None:
+            return psutil.pids()
+            
+        capacity = ENUM_PROCESSES_INITIAL
+        while True:
+            pids = (wintypes.DWORD * capacity)()
+            needed = wintypes.DWORD()
+            if not _EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+                raise ctypes.WinError(ctypes.get_last_error())
+                
+            count = needed.value // ctypes.sizeof(wintypes.DWORD)
+            # Buffer cheio: pode haver mais processos, tenta de novo com o dobro
+            if count < capacity:
+                return pids[:count]
+            capacity *= 2
             
-            return chunk_size
+    def _clear_standby_cache(self) -> int:
+        """Limpa cache de standby (MemoryPurgeStandbyList, como o RAMMap)
+        
+        Returns:
+            int: bytes descartados do cache do sistema
+        """
+        try:
+            # Esvazia a lista de standby direto no gerenciador de memória; a
+            # queda do cache do sistema é o standby realmente liberado
+            cache_before = self._memstatus().cache
+            if not self._set_memory_list(MEMORY_PURGE_STANDBY_LIST):
+                return 0
+                
+            return max(0, cache_before - self._memstatus().cache)
             
         except Exception as e:
-            self.logger.error(f"Erro na limpeza forçada: {e}")
+            self.logger.error(f"Erro na limpeza de standby: {e}")
             return 0
             
     def _trigger_garbage_collection(self):
-        """Dispara coleta de lixo do sistema"""
+        """Dispara coleta de lixo do processo (todas as gerações)"""
         try:
-            import gc
             gc.collect()
             
-            # Força limpeza de buffers do sistema
-            if os.name == 'nt':
-                subprocess.run('echo off | clip', shell=True, capture_output=True)
-                
         except Exception as e:
             self.logger.error(f"Erro na coleta de lixo: {e}")
             
@@ -270,30 +693,17 @@ class OptimizationEngine:
         
         try:
             with winreg.OpenKey(hkey, subkey, 0, winreg.KEY_ALL_ACCESS) as key:
-                i = 0
-                while True:
-                    try:
-                        name, value, _ = winreg.EnumValue(key, i)
-                        
-                        # Lista de programas seguros para desabilitar
-                        safe_to_disable = [
-                            'spotify', 'discord', 'steam', 'epic', 'origin',
-                            'skype', 'zoom', 'teams', 'slack', 'adobe',
-                            'office', 'onedrive', 'dropbox', 'googledrive'
-                        ]
-                        
-                        if any(app in name.lower() or app in value.lower() 
-                               for app in safe_to_disable):
-                            # Move para chave de backup
-                            backup_key = subkey + "_Disabled"
-                            self._backup_and_remove_startup_item(hkey, backup_key, name, value)
-                            disabled_items.append(name)
-                            
-                        i += 1
-                        
-                    except WindowsError:
-                        break
-                        
+                # Lê todos os valores antes de remover algum: a remoção desloca os índices
+                value_count = winreg.QueryInfoKey(key)[1]
+                values = [winreg.EnumValue(key, i)[:2] for i in range(value_count)]
+                
+            backup_key = subkey + "_Disabled"
+            for name, value in values:
+                if SAFE_TO_DISABLE_STARTUP_RE.search(name) or SAFE_TO_DISABLE_STARTUP_RE.search(str(value)):
+                    # Move para chave de backup
+                    self._backup_and_remove_startup_item(hkey, backup_key, name, value)
+                    disabled_items.append(name)
+                    
         except Exception as e:
             self.logger.error(f"Erro no registro de startup: {e}")
             
@@ -323,14 +733,12 @@ class OptimizationEngine:
                 backup_folder = folder_path + "_Disabled"
                 os.makedirs(backup_folder, exist_ok=True)
                 
-                for item in os.listdir(folder_path):
-                    item_path = os.path.join(folder_path, item)
-                    backup_path = os.path.join(backup_folder, item)
-                    
-                    # Move itens não essenciais
-                    if item.lower().endswith(('.lnk', '.exe')):
-                        os.rename(item_path, backup_path)
-                        disabled_items.append(item)
+                with os.scandir(folder_path) as it:
+                    for entry in it:
+                        # Move itens não essenciais (os.replace sobrescreve um backup antigo)
+                        if entry.name.lower().endswith(('.lnk', '.exe')) and entry.is_file():
+                            os.replace(entry.path, os.path.join(backup_folder, entry.name))
+                            disabled_items.append(entry.name)
                         
         except Exception as e:
             self.logger.error(f"Erro na pasta de startup: {e}")
@@ -371,9 +779,15 @@ class OptimizationEngine:
             
             optimized_services = []
             
-            for service_name, target_state in services_to_optimize.items():
-                if self._optimize_service(service_name, target_state):
-                    optimized_services.append(f"{service_name} -> {target_state}")
+            # Uma conexão com o SCM para todos os serviços (sc.exe só como alternativa)
+            scm = _OpenSCManagerW(None, None, SC_MANAGER_CONNECT) if _advapi32 is not None else None
+            try:
+                for service_name, target_state in services_to_optimize.items():
+                    if self._optimize_service(service_name, target_state, scm):
+                        optimized_services.append(f"{service_name} -> {target_state}")
+            finally:
+                if scm:
+                    _CloseServiceHandle(scm)
                     
             return {
                 "success": True,
@@ -385,25 +799,31 @@ class OptimizationEngine:
             self.logger.error(f"Erro na otimização de serviços: {e}")
             return {"success": False, "error": str(e)}
             
-    def _optimize_service(self, service_name: str, target_state: str) -> bool:
-        """Otimiza um serviço específico"""
+    def _optimize_service(self, service_name: str, target_state: str, scm=None) -> bool:
+        """Otimiza um serviço específico
+        
+        Com um handle do SCM usa ChangeServiceConfigW + ControlService; se a
+        API falhar (exceto serviço inexistente), recorre ao sc.exe.
+        """
         try:
-            if not self.is_admin:
+            if target_state not in SERVICE_START_TYPES:
                 return False
+            start_type, sc_start = SERVICE_START_TYPES[target_state]
+            
+            if scm:
+                error = self._configure_service(scm, service_name, start_type)
+                if error == 0:
+                    return True
+                if error == ERROR_SERVICE_DOES_NOT_EXIST:
+                    return False
+                self.logger.debug(f"API de serviços falhou em {service_name} (código {error}); usando sc.exe")
                 
             # Comando para alterar serviço
-            if target_state == "disabled":
-                cmd = f'sc config "{service_name}" start= disabled'
-            elif target_state == "manual":
-                cmd = f'sc config "{service_name}" start= demand'
-            else:
-                return False
-                
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            result = _run(['sc', 'config', service_name, 'start=', sc_start])
             
             if result.returncode == 0:
                 # Para o serviço se estiver rodando
-                subprocess.run(f'sc stop "{service_name}"', shell=True, capture_output=True)
+                _run(['sc', 'stop', service_name])
                 return True
                 
         except Exception as e:
@@ -411,6 +831,30 @@ class OptimizationEngine:
             
         return False
         
+    @staticmethod
+    def _configure_service(scm, service_name: str, start_type: int) -> int:
+        """Altera o tipo de início e para o serviço pela API do SCM
+        
+        Returns:
+            int: 0 em sucesso ou o código de erro do Windows
+        """
+        service = _OpenServiceW(scm, service_name, SERVICE_CHANGE_CONFIG | SERVICE_STOP)
+        if not service:
+            return ctypes.get_last_error()
+            
+        try:
+            if not _ChangeServiceConfigW(service, SERVICE_NO_CHANGE, start_type, SERVICE_NO_CHANGE,
+                                         None, None, None, None, None, None, None):
+                return ctypes.get_last_error()
+                
+            # Para o serviço se estiver rodando; como no sc stop, uma falha aqui
+            # (ex.: serviço já parado) não invalida a configuração aplicada
+            status = SERVICE_STATUS()
+            _ControlService(service, SERVICE_CONTROL_STOP, ctypes.byref(status))
+            return 0
+        finally:
+            _CloseServiceHandle(service)
+            
     def optimize_network(self) -> Dict[str, any]:
         """Otimiza configurações de rede para jogos"""
         try:
@@ -435,10 +879,6 @@ class OptimizationEngine:
                 ('netsh int tcp set global timestamps=enabled', 'TCP Timestamps')
             ]
             
-            for cmd, description in tcp_optimizations:
-                if self._run_network_command(cmd):
-                    optimizations.append(description)
-                    
             # Otimizações de interface de rede
             network_optimizations = [
                 ('netsh int ip set global taskoffload=enabled', 'Task Offload'),
@@ -446,9 +886,8 @@ class OptimizationEngine:
                 ('netsh int ip set global routecachelimit=4096', 'Route Cache Limit')
             ]
             
-            for cmd, description in network_optimizations:
-                if self._run_network_command(cmd):
-                    optimizations.append(description)
+            # Todos os comandos em um único processo netsh
+            optimizations.extend(self._run_network_commands(tcp_optimizations + network_optimizations))
                     
             # DNS otimizado
             self._optimize_dns()
@@ -469,13 +908,65 @@ class OptimizationEngine:
             self.logger.error(f"Erro na otimização de rede: {e}")
             return {"success": False, "error": str(e)}
             
+    def _run_network_commands(self, commands: List[Tuple[str, str]]) -> List[str]:
+        """Executa vários comandos netsh em um único processo (netsh -f script)
+        
+        Com código de saída 0 e só linhas "Ok.", todos foram aplicados. Senão,
+        as linhas "Ok." do início da saída confirmam os primeiros comandos e as
+        do fim confirmam os últimos; só os comandos entre elas (cuja saída é a
+        mensagem de erro, de qualquer tamanho) são repetidos um a um.
+        
+        Args:
+            commands: pares (comando netsh completo, descrição)
+            
+        Returns:
+            List[str]: descrições dos comandos aplicados com sucesso
+        """
+        script_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', prefix='fpspack_netsh_',
+                                             delete=False) as script:
+                script_path = script.name
+                for cmd, _ in commands:
+                    # Dentro do script o contexto já é o netsh
+                    script.write(cmd[len('netsh '):] if cmd.startswith('netsh ') else cmd)
+                    script.write('\n')
+                    
+            result = _run(['netsh', '-f', script_path])
+            ok_lines = [line.strip().rstrip('.').lower() == 'ok'
+                        for line in (result.stdout or '').splitlines() if line.strip()]
+            if result.returncode == 0 and ok_lines and all(ok_lines):
+                return [description for _, description in commands]
+                
+            # Confirmados pelo início e pelo fim da saída (sem sobreposição)
+            head = 0
+            while head < min(len(ok_lines), len(commands)) and ok_lines[head]:
+                head += 1
+            tail = 0
+            while (head + tail < len(commands) and tail < len(ok_lines) - head
+                   and ok_lines[-1 - tail]):
+                tail += 1
+            unclear = commands[head:len(commands) - tail]
+            
+        except Exception as e:
+            self.logger.error(f"Erro no script de rede: {e}")
+            head, tail, unclear = 0, 0, commands
+            
+        finally:
+            if script_path:
+                try:
+                    os.remove(script_path)
+                except OSError:
+                    pass
+                    
+        return ([description for _, description in commands[:head]]
+                + [description for cmd, description in unclear if self._run_network_command(cmd)]
+                + [description for _, description in commands[len(commands) - tail:]])
+        
     def _run_network_command(self, cmd: str) -> bool:
         """Executa comando de rede"""
         try:
-            if not self.is_admin:
-                return False
-                
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            result = _run(cmd.split())
             return result.returncode == 0
             
         except Exception as e:
@@ -490,10 +981,10 @@ class OptimizationEngine:
             
             # Configura DNS
             for i, dns in enumerate(dns_servers):
-                cmd = f'netsh interface ip set dns "Ethernet" static {dns}'
+                args = ['netsh', 'interface', 'ip', 'set', 'dns', 'Ethernet', 'static', dns]
                 if i > 0:
-                    cmd = f'netsh interface ip add dns "Ethernet" {dns} index={i+1}'
-                subprocess.run(cmd, shell=True, capture_output=True)
+                    args = ['netsh', 'interface', 'ip', 'add', 'dns', 'Ethernet', dns, f'index={i+1}']
+                _run(args)
                 
         except Exception as e:
             self.logger.error(f"Erro na configuração de DNS: {e}")
@@ -501,29 +992,20 @@ class OptimizationEngine:
     def _optimize_mtu(self) -> Optional[int]:
         """Tenta ajustar MTU para a interface ativa (Windows). Retorna MTU aplicado ou None."""
         try:
-            if not self.is_admin:
-                self.logger.warning("Ajuste de MTU requisita privilégios de administrador")
-                return None
-
             # Detecta interface em uso via rota padrão
-            result = subprocess.run('route PRINT 0.0.0.0', shell=True, capture_output=True, text=True)
+            result = _run(['route', 'PRINT', '0.0.0.0'])
             output = result.stdout or result.stderr
 
             # Tenta extrair nome da interface (heurística simples)
-            import re
-            m = re.search(r"0.0.0.0\s+0.0.0.0\s+[0-9.]+\.[0-9.]+\s+[0-9.]+\s+(\d+)", output)
+            m = DEFAULT_ROUTE_RE.search(output)
             if m:
                 iface_index = m.group(1)
                 # Comando para ajustar MTU (exemplo: define 1500)
                 mtu_value = 1500
                 # Tenta aplicar para interfaces Ethernet/Wi-Fi via netsh
-                cmds = [
-                    f'netsh interface ipv4 set subinterface "{iface_index}" mtu={mtu_value} store=persistent',
-                    f'netsh interface ipv6 set subinterface "{iface_index}" mtu={mtu_value} store=persistent'
-                ]
-
-                for cmd in cmds:
-                    subprocess.run(cmd, shell=True, capture_output=True)
+                for ip_version in ('ipv4', 'ipv6'):
+                    _run(['netsh', 'interface', ip_version, 'set', 'subinterface', iface_index,
+                          f'mtu={mtu_value}', 'store=persistent'])
 
                 return mtu_value
 
@@ -551,6 +1033,10 @@ class OptimizationEngine:
             if plan_type not in power_plans:
                 return {"success": False, "error": "Tipo de plano inválido"}
             
+            # Plano personalizado já criado: basta reativá-lo
+            if plan_type == "maximum" and self._turbo_plan_guid:
+                return self._create_optimized_power_plan()
+            
             plan_guid = power_plans[plan_type]
             plan_names = {
                 "maximum": "Desempenho Máximo",
@@ -559,7 +1045,7 @@ class OptimizationEngine:
             }
             
             # Ativa o plano
-            result = subprocess.run(f'powercfg -setactive {plan_guid}', shell=True, capture_output=True, text=True)
+            result = _run(['powercfg', '-setactive', plan_guid])
             
             if result.returncode == 0:
                 # Se for máximo, cria plano personalizado otimizado
@@ -587,9 +1073,20 @@ class OptimizationEngine:
             # Nome do plano personalizado
             plan_name = "FPSPACK Performance Mode"
             
+            # Reutiliza o plano criado anteriormente (já configurado) em vez de duplicar outro
+            if self._turbo_plan_guid:
+                if _run(['powercfg', '-setactive', self._turbo_plan_guid]).returncode == 0:
+                    return {
+                        "success": True,
+                        "plan_name": plan_name,
+                        "plan_guid": self._turbo_plan_guid,
+                        "plan_type": "maximum"
+                    }
+                # Plano removido externamente: cria de novo
+                self._turbo_plan_guid = None
+            
             # Cria plano baseado no Ultimate Performance
-            cmd = f'powercfg -duplicatescheme e9a42b02-d5df-448d-aa00-03f14749eb61 "{plan_name}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            result = _run(['powercfg', '-duplicatescheme', 'e9a42b02-d5df-448d-aa00-03f14749eb61', plan_name])
             
             if result.returncode == 0:
                 # Extrai GUID do novo plano
@@ -597,10 +1094,11 @@ class OptimizationEngine:
                 
                 if plan_guid:
                     # Ativa o plano
-                    subprocess.run(f'powercfg -setactive {plan_guid}', shell=True)
+                    _run(['powercfg', '-setactive', plan_guid])
                     
                     # Configura otimizações específicas
                     self._configure_power_plan(plan_guid)
+                    self._turbo_plan_guid = plan_guid
                     
                     return {
                         "success": True,
@@ -631,14 +1129,18 @@ class OptimizationEngine:
     def _extract_plan_guid(self, output: str) -> Optional[str]:
         """Extrai GUID do plano de energia"""
         try:
-            import re
-            match = re.search(r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', output)
+            match = PLAN_GUID_RE.search(output)
             return match.group(1) if match else None
         except:
             return None
             
     def _configure_power_plan(self, plan_guid: str):
-        """Configura otimizações do plano de energia"""
+        """Configura otimizações do plano de energia
+        
+        Grava os índices com PowerWriteACValueIndex, sem um powercfg por
+        configuração, e reaplica o plano para que entrem em vigor. O powercfg
+        fica para as configurações que a API não gravar.
+        """
         try:
             # Configurações de performance máxima
             settings = [
@@ -651,9 +1153,21 @@ class OptimizationEngine:
                 ('SUB_DISK', 'DISKIDLE', '0')                 # Disco sempre ativo
             ]
             
-            for subgroup, setting, value in settings:
-                cmd = f'powercfg -setacvalueindex {plan_guid} {subgroup} {setting} {value}'
-                subprocess.run(cmd, shell=True, capture_output=True)
+            pending = settings
+            if _powrprof is not None:
+                scheme = GUID.from_string(plan_guid)
+                pending = [
+                    (subgroup, setting, value) for subgroup, setting, value in settings
+                    if _PowerWriteACValueIndex(None, ctypes.byref(scheme),
+                                               ctypes.byref(GUID.from_string(POWER_SETTING_GUIDS[subgroup])),
+                                               ctypes.byref(GUID.from_string(POWER_SETTING_GUIDS[setting])),
+                                               int(value)) != 0
+                ]
+                # Valores gravados no plano ativo só valem depois de reaplicá-lo
+                _PowerSetActiveScheme(None, ctypes.byref(scheme))
+                
+            for subgroup, setting, value in pending:
+                _run(['powercfg', '-setacvalueindex', plan_guid, subgroup, setting, value])
                 
         except Exception as e:
             self.logger.error(f"Erro na configuração do plano: {e}")
@@ -692,19 +1206,38 @@ class OptimizationEngine:
             return {"success": False, "error": str(e)}
             
     def _boost_process_priorities(self):
-        """Otimiza prioridades de processos"""
+        """Otimiza prioridades de processos
+        
+        No Windows cada PID é aberto uma vez: o mesmo handle serve para ler o
+        nome da imagem e para o SetPriorityClass, sem objetos psutil.Process.
+        """
         try:
-            # Processos para aumentar prioridade
-            important_processes = ['dwm.exe', 'explorer.exe', 'winlogon.exe']
-            
-            for proc in psutil.process_iter(['pid', 'name']):
+            if _kernel32 is not None:
+                access = PROCESS_SET_INFORMATION | PROCESS_QUERY_LIMITED_INFORMATION
+                image = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
+                for pid in self._enum_process_ids():
+                    handle = _OpenProcess(access, False, pid)
+                    if not handle:
+                        continue
+                    try:
+                        # Caminho de dispositivo (\Device\HarddiskVolumeN\...): só o nome importa
+                        length = _GetProcessImageFileNameW(handle, image, len(image))
+                        if length and image.value.rsplit('\\', 1)[-1].lower() in PRIORITY_BOOST_PROCESSES:
+                            _SetPriorityClass(handle, HIGH_PRIORITY_CLASS)
+                    finally:
+                        _CloseHandle(handle)
+                return
+                
+            for proc in psutil.process_iter():
                 try:
-                    if proc.info['name'].lower() in important_processes:
-                        p = psutil.Process(proc.info['pid'])
-                        try:
-                            p.nice(psutil.HIGH_PRIORITY_CLASS)
-                        except Exception:
-                            pass
+                    # oneshot agrupa as leituras do processo em uma consulta ao kernel
+                    with proc.oneshot():
+                        if proc.name().lower() not in PRIORITY_BOOST_PROCESSES:
+                            continue
+                    try:
+                        proc.nice(psutil.HIGH_PRIORITY_CLASS)
+                    except Exception:
+                        pass
                         
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -713,19 +1246,33 @@ class OptimizationEngine:
             self.logger.error(f"Erro nas prioridades: {e}")
             
     def _quick_cache_cleanup(self):
-        """Limpeza rápida de cache"""
+        """Limpeza rápida de cache
+        
+        O cache DNS é limpo em processo (DnsFlushResolverCache); só o cache de
+        ícones, sem API equivalente, exige processo. Se a API falhar, os dois
+        comandos rodam lado a lado, então o custo de criação de processo não se soma.
+        """
         try:
-            # Limpa cache DNS
-            subprocess.run('ipconfig /flushdns', shell=True, capture_output=True)
+            commands = [['ie4uinit.exe', '-ClearIconCache']]   # Limpa cache de ícones
             
-            # Limpa cache de ícones
-            subprocess.run('ie4uinit.exe -ClearIconCache', shell=True, capture_output=True)
+            # Limpa cache DNS: mesma API usada pelo ipconfig /flushdns
+            if not flush_dns_cache():
+                commands.append(['ipconfig', '/flushdns'])
+                
+            with ThreadPoolExecutor(max_workers=len(commands), thread_name_prefix="FPSPackCache") as executor:
+                list(executor.map(_run, commands))
             
         except Exception as e:
             self.logger.error(f"Erro na limpeza de cache: {e}")
             
     def activate_turbo_mode(self) -> Dict[str, any]:
-        """Ativa modo turbo com todas as otimizações"""
+        """Ativa modo turbo com todas as otimizações
+        
+        As etapas são independentes e dominadas por E/S (registro, SCM,
+        subprocessos): rodam em paralelo e o tempo total é o da mais lenta. A
+        limpeza de RAM roda depois delas, para que a memória que as etapas
+        alocam e liberam não entre na medição do que foi liberado.
+        """
         try:
             self.logger.info("Ativando Modo Turbo...")
 
@@ -734,41 +1281,50 @@ class OptimizationEngine:
                 self.logger.warning("Modo Turbo requer privilégios de administrador")
                 return self._admin_required_response("Aplicar plano de energia")
             
-            if self.optimization_active:
-                return {"success": False, "error": "Modo Turbo já está ativo"}
+            with self._turbo_lock:
+                if self.optimization_active:
+                    return {"success": False, "error": "Modo Turbo já está ativo"}
+                if self._turbo_activating:
+                    return {"success": False, "error": "Modo Turbo já está sendo ativado"}
+                self._turbo_activating = True
                 
-            results = []
-            
-            # Aplica perfil máximo
-            profile = self.optimization_profiles["maximum"]
-            
-            # 1. Limpeza de RAM
-            if profile["settings"]["ram_cleanup"]:
-                ram_result = self.clean_ram()
-                if ram_result["success"]:
-                    results.append(f"RAM: {ram_result['freed_gb']:.1f} GB liberados")
-                    
-            # 2. Otimização de serviços
-            services_result = self.optimize_services()
-            if services_result["success"]:
-                results.append(f"Serviços: {services_result['total_optimized']} otimizados")
-                
-            # 3. Otimização de rede
-            network_result = self.optimize_network()
-            if network_result["success"]:
-                results.append(f"Rede: {network_result['total_optimizations']} otimizações")
+            try:
+                results = []
                 
-            # 4. Plano de energia
-            power_result = self.set_power_plan("maximum")
-            if power_result["success"]:
-                results.append("Plano de energia criado")
+                # Aplica perfil máximo
+                profile = self.optimization_profiles["maximum"]
                 
-            # 5. Startup
-            startup_result = self.optimize_startup()
-            if startup_result["success"]:
-                results.append(f"Startup: {startup_result['total_disabled']} itens desabilitados")
+                # Etapas paralelas: (função, descrição do resultado bem-sucedido)
+                tasks = [
+                    # 2. Otimização de serviços
+                    (self.optimize_services, lambda r: f"Serviços: {r['total_optimized']} otimizados"),
+                    # 3. Otimização de rede
+                    (self.optimize_network, lambda r: f"Rede: {r['total_optimizations']} otimizações"),
+                    # 4. Plano de energia
+                    (lambda: self.set_power_plan("maximum"), lambda r: "Plano de energia criado"),
+                    # 5. Startup
+                    (self.optimize_startup, lambda r: f"Startup: {r['total_disabled']} itens desabilitados"),
+                ]
                 
-            self.optimization_active = True
+                with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="FPSPackTurbo") as executor:
+                    futures = [(executor.submit(func), describe) for func, describe in tasks]
+                    # Resultados na ordem das etapas
+                    for future, describe in futures:
+                        result = future.result()
+                        if result["success"]:
+                            results.append(describe(result))
+                            
+                # 1. Limpeza de RAM (sozinha, após as demais; listada primeiro)
+                if profile["settings"]["ram_cleanup"]:
+                    ram_result = self.clean_ram()
+                    if ram_result["success"]:
+                        results.insert(0, f"RAM: {ram_result['freed_gb']:.1f} GB liberados")
+                        
+                with self._turbo_lock:
+                    self.optimization_active = True
+            finally:
+                with self._turbo_lock:
+                    self._turbo_activating = False
             
             return {
                 "success": True,
@@ -789,7 +1345,10 @@ class OptimizationEngine:
             # Restaura configurações padrão
             # (implementar restauração de backups)
             
-            self.optimization_active = False
+            with self._turbo_lock:
+                if self._turbo_activating:
+                    return {"success": False, "error": "Modo Turbo ainda está sendo ativado; tente novamente"}
+                self.optimization_active = False
             
             return {"success": True, "message": "Modo Turbo desativado"}
             
@@ -799,13 +1358,14 @@ class OptimizationEngine:
             
     def get_optimization_status(self) -> Dict[str, any]:
         """Retorna status das otimizações"""
+        memory = self._memstatus()
         return {
             "turbo_mode_active": self.optimization_active,
             "admin_privileges": self.is_admin,
             "available_profiles": list(self.optimization_profiles.keys()),
             "system_info": {
                 "cpu_count": psutil.cpu_count(),
-                "memory_total": psutil.virtual_memory().total / (1024**3),
-                "memory_available": psutil.virtual_memory().available / (1024**3)
+                "memory_total": memory.total / (1024**3),
+                "memory_available": memory.available / (1024**3)
             }
         }
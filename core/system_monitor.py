@@ -5,13 +5,26 @@ Monitor de Sistema do FPSPACK PANEL
 Coleta informações em tempo real do sistema
 """
 
+import os
+import heapq
 import psutil
 import time
 import threading
+from collections import deque
 from typing import Dict, List, Optional
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, QTimer, QRunnable, QThreadPool, QThread
 from utils.logger import Logger
 
+# Amostragem do monitor: consultas caras rodam apenas a cada N ticks
+PROCESS_SAMPLE_TICKS = 5    # process_iter
+PARTITION_USAGE_TICKS = 5   # disk_usage de cada partição (o C: é lido a cada tick)
+SLOW_QUERY_TICKS = 30       # disk_partitions / net_if_stats (topologia raramente muda)
+DISK_USAGE_TTL = 0.5        # segundos de validade do cache de disk_usage
+
+# No Windows o getloadavg do psutil é emulado por uma thread de amostragem em
+# segundo plano; só é lido onde o kernel fornece o valor nativamente
+NATIVE_LOADAVG = os.name != 'nt' and hasattr(psutil, 'getloadavg')
+
 class SystemMonitor(QObject):
     # Sinais para atualização da interface
     system_updated = Signal(dict)
@@ -22,97 +35,124 @@ class SystemMonitor(QObject):
         self.monitoring = False
         self.update_interval = 1000  # 1 segundo
 
-        # Histórico de dados
-        self.cpu_history = []
-        self.ram_history = []
-        self.disk_history = []
-        self.network_history = []
-        self.temp_history = []
-
         # Configurações de monitoramento
         self.max_history_points = 60  # 1 minuto de histórico
 
-        # Worker thread para coletar dados do sistema sem bloquear a UI
-        self._worker: Optional[QThread] = None
+        # Histórico de dados (deque descarta o ponto mais antigo sozinho)
+        self.cpu_history = deque(maxlen=self.max_history_points)
+        self.ram_history = deque(maxlen=self.max_history_points)
+        self.disk_history = deque(maxlen=self.max_history_points)
+        self.network_history = deque(maxlen=self.max_history_points)
+        self.temp_history = deque(maxlen=self.max_history_points)
+
+        # Timer (thread da UI) que dispara coletas em um pool próprio de uma
+        # thread com prioridade baixa: o monitor não disputa CPU com o jogo/UI
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._start_sample)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setThreadPriority(QThread.LowPriority)
+        # True enquanto um snapshot emitido ainda não foi entregue na thread da UI;
+        # ticks são descartados nesse intervalo para a fila de eventos não crescer
+        self._pending = False
+        self.system_updated.connect(self._on_snapshot_delivered)
 
         # Informações de rede anteriores para calcular velocidade
         self.prev_network_io = None
         self.prev_network_time = None
+
+        # Estado da coleta em passada única (ver collect_system_data)
+        self._tick = 0
+        self._process_info: Optional[Dict] = None
+        self._partitions: Optional[list] = None
+        self._partition_usage: Optional[list] = None
+        self._interfaces: Optional[list] = None
+        # Sem sensores de temperatura (ex.: Windows): a varredura é pulada nas próximas coletas
+        self._temp_unavailable = False
+        self._default_temp = {'cpu_temp': 45, 'all_temperatures': {}, 'has_sensors': False}
+        # Cache de disk_usage: caminho -> (instante, resultado)
+        self._disk_usage_cache: Dict[str, tuple] = {}
         
     def start_monitoring(self):
         """Inicia o monitoramento do sistema"""
         if not self.monitoring:
             self.monitoring = True
-            # Inicia worker que coleta dados periodicamente fora da thread da UI
-            self._worker = MonitorWorker(self, self.update_interval)
-            self._worker.data_ready.connect(self.system_updated.emit)
-            self._worker.start()
-            self.logger.info("Monitoramento do sistema iniciado (worker thread)")
+            self._pending = False
+            # Coletas rodam em threads do pool, fora da thread da UI
+            self._start_sample()
+            self._timer.start(max(100, int(self.update_interval)))
+            self.logger.info("Monitoramento do sistema iniciado (thread pool)")
             
     def stop_monitoring(self):
         """Para o monitoramento do sistema"""
         if self.monitoring:
             self.monitoring = False
-            # Para o worker
-            try:
-                if self._worker:
-                    self._worker.stop()
-                    self._worker = None
-            except Exception:
-                pass
+            self._timer.stop()
             self.logger.info("Monitoramento do sistema parado")
-            
-    def update_system_info(self):
-        """Atualiza informações do sistema"""
-        try:
-            # Coleta informações
-            cpu_info = self.get_cpu_info()
-            memory_info = self.get_memory_info()
-            disk_info = self.get_disk_info()
-            network_info = self.get_network_info()
-            temp_info = self.get_temperature_info()
-            process_info = self.get_process_info()
-            
-            # Atualiza históricos
-            self._update_history(self.cpu_history, cpu_info['percent'])
-            self._update_history(self.ram_history, memory_info['percent'])
-            self._update_history(self.disk_history, disk_info['percent'])
-            self._update_history(self.temp_history, temp_info['cpu_temp'])
-            
-            # Monta dados completos
-            system_data = {
-                'cpu': cpu_info,
-                'memory': memory_info,
-                'disk': disk_info,
-                'network': network_info,
-                'temperature': temp_info,
-                'processes': process_info,
-                'history': {
-                    'cpu': self.cpu_history.copy(),
-                    'ram': self.ram_history.copy(),
-                    'disk': self.disk_history.copy(),
-                    'temp': self.temp_history.copy()
-                },
-                'timestamp': time.time()
-            }
-            
-            # Emite sinal com os dados
-            self.system_updated.emit(system_data)
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao atualizar informações do sistema: {e}")
+
+    def _start_sample(self):
+        """Agenda uma coleta no pool do monitor
+        Se a coleta anterior ainda estiver rodando, tryStart recusa e o tick é descartado;
+        o mesmo vale enquanto a UI não consumiu o último snapshot."""
+        if self._pending:
+            return
+        self._pool.tryStart(SampleTask(self))
+
+    def _on_snapshot_delivered(self, _system_data: dict):
+        """Confirma (na thread da UI) a entrega do último snapshot"""
+        self._pending = False
+            
+    def collect_system_data(self) -> Dict[str, any]:
+        """Coleta um snapshot completo do sistema em uma única passada
+        Cada consulta psutil é feita no máximo uma vez por tick; a lista de
+        processos e a topologia de discos/interfaces são reaproveitadas entre
+        as reamostragens (PROCESS_SAMPLE_TICKS / PARTITION_USAGE_TICKS /
+        SLOW_QUERY_TICKS)."""
+        refresh_slow = self._tick % SLOW_QUERY_TICKS == 0
+        refresh_usage = self._tick % PARTITION_USAGE_TICKS == 0
+        if self._process_info is None or self._tick % PROCESS_SAMPLE_TICKS == 0:
+            self._process_info = self.get_process_info()
+        self._tick += 1
+
+        cpu = self.get_cpu_info()
+        memory = self.get_memory_info()
+        disk = self.get_disk_info(refresh_partitions=refresh_slow, refresh_usage=refresh_usage)
+        network = self.get_network_info(refresh_interfaces=refresh_slow)
+        temp = self.get_temperature_info()
+
+        # Atualiza históricos
+        self._update_history(self.cpu_history, cpu.get('percent', 0))
+        self._update_history(self.ram_history, memory.get('percent', 0))
+        self._update_history(self.disk_history, disk.get('percent', 0))
+        self._update_history(self.temp_history, temp.get('cpu_temp', 0))
+
+        return {
+            'cpu': cpu,
+            'memory': memory,
+            'disk': disk,
+            'network': network,
+            'temperature': temp,
+            'processes': self._process_info,
+            # Tuplas imutáveis: podem ser compartilhadas entre consumidores sem cópia
+            'history': {
+                'cpu': tuple(self.cpu_history),
+                'ram': tuple(self.ram_history),
+                'disk': tuple(self.disk_history),
+                'temp': tuple(self.temp_history)
+            },
+            'timestamp': time.time()
+        }
             
     def get_cpu_info(self) -> Dict[str, any]:
         """Obtém informações da CPU"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=None)
+            # CPU por core; o total é a média dos cores (uma única amostragem)
+            cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+            cpu_percent = sum(cpu_per_core) / len(cpu_per_core) if cpu_per_core else 0.0
             cpu_freq = psutil.cpu_freq()
             cpu_count = psutil.cpu_count()
             cpu_count_logical = psutil.cpu_count(logical=True)
             
-            # CPU por core
-            cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
-            
             return {
                 'percent': cpu_percent,
                 'frequency_current': cpu_freq.current if cpu_freq else 0,
@@ -120,7 +160,7 @@ class SystemMonitor(QObject):
                 'cores_physical': cpu_count,
                 'cores_logical': cpu_count_logical,
                 'per_core': cpu_per_core,
-                'load_avg': psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0, 0, 0]
+                'load_avg': psutil.getloadavg() if NATIVE_LOADAVG else [0, 0, 0]
             }
             
         except Exception as e:
@@ -158,32 +198,43 @@ class SystemMonitor(QObject):
                    'swap_total': 0, 'swap_used': 0, 'swap_percent': 0,
                    'swap_total_gb': 0, 'swap_used_gb': 0}
             
-    def get_disk_info(self) -> Dict[str, any]:
-        """Obtém informações do disco"""
+    def get_disk_info(self, refresh_partitions: bool = True, refresh_usage: bool = True) -> Dict[str, any]:
+        """Obtém informações do disco
+        
+        Args:
+            refresh_partitions: Se False, reutiliza a última lista de partições
+            refresh_usage: Se False, reutiliza o último uso lido de cada partição
+        """
         try:
             # Disco principal (C:)
-            disk_usage = psutil.disk_usage('C:')
+            disk_usage = self._disk_usage('C:')
             disk_io = psutil.disk_io_counters()
             
             # Informações de todas as partições
-            partitions = []
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    partitions.append({
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total': usage.total,
-                        'used': usage.used,
-                        'free': usage.free,
-                        'percent': (usage.used / usage.total) * 100,
-                        'total_gb': usage.total / (1024**3),
-                        'used_gb': usage.used / (1024**3),
-                        'free_gb': usage.free / (1024**3)
-                    })
-                except PermissionError:
-                    continue
+            if refresh_partitions or self._partitions is None:
+                self._partitions = psutil.disk_partitions()
+                refresh_usage = True
+
+            if refresh_usage or self._partition_usage is None:
+                self._partition_usage = []
+                for partition in self._partitions:
+                    try:
+                        usage = psutil.disk_usage(partition.mountpoint)
+                        self._partition_usage.append({
+                            'device': partition.device,
+                            'mountpoint': partition.mountpoint,
+                            'fstype': partition.fstype,
+                            'total': usage.total,
+                            'used': usage.used,
+                            'free': usage.free,
+                            'percent': (usage.used / usage.total) * 100,
+                            'total_gb': usage.total / (1024**3),
+                            'used_gb': usage.used / (1024**3),
+                            'free_gb': usage.free / (1024**3)
+                        })
+                    except PermissionError:
+                        continue
+            partitions = self._partition_usage
                     
             return {
                 'total': disk_usage.total,
@@ -207,8 +258,12 @@ class SystemMonitor(QObject):
                    'read_bytes': 0, 'write_bytes': 0, 'read_count': 0, 'write_count': 0,
                    'partitions': []}
             
-    def get_network_info(self) -> Dict[str, any]:
-        """Obtém informações da rede"""
+    def get_network_info(self, refresh_interfaces: bool = True) -> Dict[str, any]:
+        """Obtém informações da rede
+        
+        Args:
+            refresh_interfaces: Se False, reutiliza a última lista de interfaces
+        """
         try:
             network_io = psutil.net_io_counters()
             current_time = time.time()
@@ -228,15 +283,17 @@ class SystemMonitor(QObject):
             self.prev_network_time = current_time
             
             # Informações de interfaces
-            interfaces = []
-            for interface_name, interface_info in psutil.net_if_stats().items():
-                interfaces.append({
-                    'name': interface_name,
-                    'is_up': interface_info.isup,
-                    'duplex': interface_info.duplex,
-                    'speed': interface_info.speed,
-                    'mtu': interface_info.mtu
-                })
+            if refresh_interfaces or self._interfaces is None:
+                self._interfaces = []
+                for interface_name, interface_info in psutil.net_if_stats().items():
+                    self._interfaces.append({
+                        'name': interface_name,
+                        'is_up': interface_info.isup,
+                        'duplex': interface_info.duplex,
+                        'speed': interface_info.speed,
+                        'mtu': interface_info.mtu
+                    })
+            interfaces = self._interfaces
                 
             return {
                 'bytes_sent': network_io.bytes_sent,
@@ -260,24 +317,30 @@ class SystemMonitor(QObject):
             
     def get_temperature_info(self) -> Dict[str, any]:
         """Obtém informações de temperatura"""
+        # Resultado padrão compartilhado (não deve ser alterado pela UI)
+        if self._temp_unavailable:
+            return self._default_temp
+            
         try:
             temperatures = {}
             cpu_temp = 0
             
             # Tenta obter temperaturas (nem sempre disponível)
-            if hasattr(psutil, 'sensors_temperatures'):
-                temps = psutil.sensors_temperatures()
+            temps = psutil.sensors_temperatures() if hasattr(psutil, 'sensors_temperatures') else None
+            if not temps:
+                self._temp_unavailable = True
+                return self._default_temp
                 
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if 'cpu' in name.lower() or 'core' in name.lower():
-                            cpu_temp = max(cpu_temp, entry.current)
-                        temperatures[f"{name}_{entry.label}"] = {
-                            'current': entry.current,
-                            'high': entry.high,
-                            'critical': entry.critical
-                        }
-                        
+            for name, entries in temps.items():
+                for entry in entries:
+                    if 'cpu' in name.lower() or 'core' in name.lower():
+                        cpu_temp = max(cpu_temp, entry.current)
+                    temperatures[f"{name}_{entry.label}"] = {
+                        'current': entry.current,
+                        'high': entry.high,
+                        'critical': entry.critical
+                    }
+                    
             # Se não conseguiu obter temperatura da CPU, usa valor padrão
             if cpu_temp == 0:
                 cpu_temp = 45  # Valor padrão simulado
@@ -293,57 +356,70 @@ class SystemMonitor(QObject):
             return {'cpu_temp': 45, 'all_temperatures': {}, 'has_sensors': False}
             
     def get_process_info(self) -> Dict[str, any]:
-        """Obtém informações dos processos"""
+        """Obtém informações dos processos
+        
+        psutil.process_iter reaproveita os objetos psutil.Process entre coletas
+        (necessário para cpu_percent) e descarta os de PIDs reutilizados, pois
+        compara também o horário de criação do processo.
+        """
         try:
             processes = []
             total_processes = 0
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+            for proc in psutil.process_iter():
+                total_processes += 1
                 try:
-                    total_processes += 1
-                    
-                    # Adiciona apenas processos com uso significativo
-                    if proc.info['cpu_percent'] > 1 or proc.info['memory_percent'] > 1:
-                        processes.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cpu_percent': proc.info['cpu_percent'],
-                            'memory_percent': proc.info['memory_percent'],
-                            'status': proc.info['status']
-                        })
+                    # oneshot agrupa as leituras do processo em uma consulta ao kernel;
+                    # nome e status só são lidos para processos com uso significativo
+                    with proc.oneshot():
+                        cpu_percent = proc.cpu_percent()
+                        memory_percent = proc.memory_percent()
+                        if cpu_percent > 1 or memory_percent > 1:
+                            processes.append({
+                                'pid': proc.pid,
+                                'name': proc.name(),
+                                'cpu_percent': cpu_percent,
+                                'memory_percent': memory_percent,
+                                'status': proc.status()
+                            })
                         
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
                     
-            # Ordena por uso de CPU
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            
+            # Top 10 por uso de CPU (heap parcial, sem ordenar a lista toda)
             return {
                 'total_processes': total_processes,
-                'top_processes': processes[:10],  # Top 10
-                'all_processes': processes
+                'top_processes': heapq.nlargest(10, processes, key=lambda x: x['cpu_percent'])
             }
             
         except Exception as e:
             self.logger.error(f"Erro ao obter informações dos processos: {e}")
-            return {'total_processes': 0, 'top_processes': [], 'all_processes': []}
-            
-    def _update_history(self, history_list: List[float], new_value: float):
-        """Atualiza lista de histórico"""
-        history_list.append(new_value)
-        
-        # Mantém apenas os últimos pontos
-        if len(history_list) > self.max_history_points:
-            history_list.pop(0)
+            return {'total_processes': 0, 'top_processes': []}
+            
+    def _update_history(self, history: deque, new_value: float):
+        """Atualiza histórico (maxlen mantém apenas os últimos pontos)"""
+        history.append(new_value)
+            
+    def _disk_usage(self, path: str):
+        """disk_usage com cache curto (DISK_USAGE_TTL); o tamanho do disco muda devagar"""
+        now = time.monotonic()
+        cached = self._disk_usage_cache.get(path)
+        if cached and now - cached[0] < DISK_USAGE_TTL:
+            return cached[1]
+        usage = psutil.disk_usage(path)
+        self._disk_usage_cache[path] = (now, usage)
+        return usage
             
     def get_current_info(self) -> Dict[str, any]:
         """Retorna informações atuais do sistema (sem histórico)"""
         try:
+            memory = psutil.virtual_memory()
+            disk = self._disk_usage('C:')
             return {
                 'cpu_percent': psutil.cpu_percent(),
-                'ram_used_gb': psutil.virtual_memory().used / (1024**3),
-                'ram_percent': psutil.virtual_memory().percent,
-                'disk_percent': (psutil.disk_usage('C:').used / psutil.disk_usage('C:').total) * 100,
+                'ram_used_gb': memory.used / (1024**3),
+                'ram_percent': memory.percent,
+                'disk_percent': (disk.used / disk.total) * 100,
                 'cpu_temp': 45,  # Valor padrão
                 'processes_count': len(psutil.pids())
             }
@@ -392,12 +468,7 @@ class SystemMonitor(QObject):
         """Define intervalo de atualização"""
         self.update_interval = interval_ms
         if self.monitoring:
-            # Se estiver monitorando via worker, reinicie o worker com novo intervalo
-            try:
-                if self._worker:
-                    self._worker.set_interval(interval_ms)
-            except Exception:
-                pass
+            self._timer.setInterval(max(100, int(interval_ms)))
             
     def get_network_connections(self) -> List[Dict[str, any]]:
         """Obtém conexões de rede ativas"""
@@ -420,66 +491,20 @@ class SystemMonitor(QObject):
             return []
 
 
-class MonitorWorker(QThread):
-    """Thread worker que coleta informações do SystemMonitor em intervalo regular
-    Emite sinal `data_ready` com o dicionário de sistema pronto para UI."""
-
-    data_ready = Signal(dict)
+class SampleTask(QRunnable):
+    """Coleta única do SystemMonitor executada na thread do pool do monitor
+    Emite `system_updated` do próprio monitor: como o SystemMonitor vive na
+    thread da UI, a entrega é um único salto enfileirado, sem sinal intermediário."""
 
-    def __init__(self, monitor: SystemMonitor, interval_ms: int = 1000):
+    def __init__(self, monitor: SystemMonitor):
         super().__init__()
         self.monitor = monitor
-        self._interval = max(100, int(interval_ms)) / 1000.0
-        self._running = True
 
     def run(self):
-        while self._running:
-            try:
-                # Coleta informações com métodos do monitor (que usam psutil)
-                cpu = self.monitor.get_cpu_info()
-                memory = self.monitor.get_memory_info()
-                disk = self.monitor.get_disk_info()
-                network = self.monitor.get_network_info()
-                temp = self.monitor.get_temperature_info()
-                processes = self.monitor.get_process_info()
-
-                # Atualiza históricos locais no monitor (rápido)
-                self.monitor._update_history(self.monitor.cpu_history, cpu.get('percent', 0))
-                self.monitor._update_history(self.monitor.ram_history, memory.get('percent', 0))
-                self.monitor._update_history(self.monitor.disk_history, disk.get('percent', 0))
-                self.monitor._update_history(self.monitor.temp_history, temp.get('cpu_temp', 0))
-
-                system_data = {
-                    'cpu': cpu,
-                    'memory': memory,
-                    'disk': disk,
-                    'network': network,
-                    'temperature': temp,
-                    'processes': processes,
-                    'history': {
-                        'cpu': self.monitor.cpu_history.copy(),
-                        'ram': self.monitor.ram_history.copy(),
-                        'disk': self.monitor.disk_history.copy(),
-                        'temp': self.monitor.temp_history.copy()
-                    },
-                    'timestamp': time.time()
-                }
-
-                # Emite dados para a UI
-                self.data_ready.emit(system_data)
-
-            except Exception as e:
-                self.monitor.logger.error(f"MonitorWorker erro: {e}")
-
-            # Sleep pelo intervalo (não bloquear a UI porque está em thread separada)
-            try:
-                time.sleep(self._interval)
-            except Exception:
-                pass
-
-    def stop(self):
-        self._running = False
-        self.wait(2000)
-
-    def set_interval(self, interval_ms: int):
-        self._interval = max(100, int(interval_ms)) / 1000.0
\ No newline at end of file
+        try:
+            # Coleta em passada única (cada consulta psutil uma vez por tick)
+            system_data = self.monitor.collect_system_data()
+            self.monitor._pending = True
+            self.monitor.system_updated.emit(system_data)
+        except Exception as e:
+            self.monitor.logger.error(f"SampleTask erro: {e}")
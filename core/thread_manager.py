@@ -8,13 +8,23 @@ Sistema centralizado de gerenciamento de threads para otimização de performanc
 import threading
 import queue
 import time
-from concurrent.futures import ThreadPoolExecutor, Future, wait
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor, Future
 from typing import Dict, List, Callable, Any, Optional
-from PySide6.QtCore import QObject, Signal, QTimer, QThread
+from PySide6.QtCore import QObject, Signal, QThread
 from utils.logger import Logger
 
+# Intervalo mínimo entre emissões de progresso de uma tarefa (~30 por segundo)
+PROGRESS_MIN_INTERVAL = 0.033
+
+# Tarefas que podem aguardar na fila do ThreadPool, por worker, além das em execução
+QUEUED_TASKS_PER_WORKER = 2
+
 class TaskResult:
     """Resultado de uma tarefa executada"""
+    __slots__ = ('task_id', 'success', 'result', 'error', 'timestamp')
+
     def __init__(self, task_id: str, success: bool, result: Any = None, error: str = None):
         self.task_id = task_id
         self.success = success
@@ -22,6 +32,72 @@ class TaskResult:
         self.error = error
         self.timestamp = time.time()
 
+class _TaskCallbacks:
+    """Callbacks de progresso/status de uma tarefa do ThreadPool
+    Guarda o task_id e os emits já resolvidos, sem criar closures por tarefa.
+    Atualizações repetidas são descartadas e o progresso é limitado a um emit
+    por PROGRESS_MIN_INTERVAL (o valor final, 100, sempre é emitido). O último
+    progresso retido no intervalo é emitido por um timer ao fim dele, mesmo que
+    a tarefa não informe mais nada. Status são raros e só são deduplicados."""
+    __slots__ = ('task_id', '_emit_progress', '_emit_status', '_lock', '_timer',
+                 '_last_progress', '_last_progress_time', '_pending_progress',
+                 '_last_status')
+
+    def __init__(self, task_id: str, progress_signal, status_signal):
+        self.task_id = task_id
+        self._emit_progress = progress_signal.emit
+        self._emit_status = status_signal.emit
+        # Serializa a thread da tarefa e a do timer (emits sempre em ordem)
+        self._lock = threading.Lock()
+        self._timer = None
+        self._last_progress = None
+        self._last_progress_time = 0.0
+        self._pending_progress = None
+        self._last_status = None
+
+    def report_progress(self, progress: int):
+        with self._lock:
+            now = time.monotonic()
+            wait = PROGRESS_MIN_INTERVAL - (now - self._last_progress_time)
+            if progress < 100 and wait > 0:
+                # Retém só o mais recente; volta a None se igual ao já emitido
+                self._pending_progress = progress if progress != self._last_progress else None
+                if self._pending_progress is not None and self._timer is None:
+                    self._timer = threading.Timer(wait, self._flush_progress)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._pending_progress = None
+            if progress == self._last_progress:
+                return
+            self._last_progress = progress
+            self._last_progress_time = now
+            self._emit_progress(self.task_id, progress)
+
+    def _flush_progress(self):
+        """Emite o progresso retido (fim do intervalo ou fim da tarefa)"""
+        with self._lock:
+            self._timer = None
+            if self._pending_progress is None:
+                return
+            self._last_progress = self._pending_progress
+            self._last_progress_time = time.monotonic()
+            self._pending_progress = None
+            self._emit_progress(self.task_id, self._last_progress)
+
+    def report_status(self, status: str):
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self._emit_status(self.task_id, status)
+
+    def flush(self):
+        """Cancela o timer pendente e emite na hora o progresso retido"""
+        timer = self._timer
+        if timer is not None:
+            timer.cancel()
+        self._flush_progress()
+
 class WorkerThread(QThread):
     """Thread worker otimizada para tarefas específicas"""
     progress_updated = Signal(str, int)  # task_id, progress
@@ -34,7 +110,6 @@ class WorkerThread(QThread):
         self.func = func
         self.args = args
         self.kwargs = kwargs
-        self.logger = Logger()
         self._is_cancelled = False
         
     def run(self):
@@ -55,7 +130,8 @@ class WorkerThread(QThread):
                 self.status_updated.emit(self.task_id, "Concluído")
                 
         except Exception as e:
-            self.logger.error(f"Erro na tarefa {self.task_id}: {e}")
+            # Logger é singleton: resolvido só no caminho de erro, não a cada tarefa
+            Logger().error(f"Erro na tarefa {self.task_id}: {e}")
             self.task_completed.emit(TaskResult(self.task_id, False, None, str(e)))
             self.status_updated.emit(self.task_id, f"Erro: {str(e)}")
             
@@ -90,23 +166,24 @@ class ThreadManager(QObject):
         
         # ThreadPool para tarefas CPU-intensivas
         self.thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FPSPack")
+        # A fila interna do executor não tem limite: as vagas limitam tarefas pendentes
+        self._pool_slots = threading.BoundedSemaphore(max_workers * (1 + QUEUED_TASKS_PER_WORKER))
         
         # Threads ativas
         self.active_threads: Dict[str, WorkerThread] = {}
         self.active_futures: Dict[str, Future] = {}
         
-        # Contador de tarefas
-        self._task_counter = 0
-        self._lock = threading.Lock()
+        # Contador de tarefas (next() de itertools.count é atômico sob o GIL)
+        self._task_seq = itertools.count(1).__next__
         
-        # Timer para limpeza
-        self.cleanup_timer = QTimer()
-        self.cleanup_timer.timeout.connect(self._cleanup_finished_tasks)
-        self.cleanup_timer.start(5000)  # Limpeza a cada 5 segundos
+        # Protege só as mutações O(1) dos dicionários de tarefas ativas
+        # (nunca é mantido durante a execução ou o cancelamento)
+        self._lock = threading.Lock()
         
         self.logger.info(f"ThreadManager inicializado com {max_workers} workers")
         
-    def submit_task(self, func: Callable, *args, task_name: str = None, use_qthread: bool = False, **kwargs) -> str:
+    def submit_task(self, func: Callable, *args, task_name: str = None, use_qthread: bool = False,
+                    block: bool = False, block_timeout: Optional[float] = None, **kwargs) -> str:
         """
         Submete uma tarefa para execução
         
@@ -115,15 +192,18 @@ class ThreadManager(QObject):
             *args: Argumentos da função
             task_name: Nome da tarefa (opcional)
             use_qthread: Se True, usa QThread ao invés do ThreadPool
+            block: Se o ThreadPool estiver cheio, espera uma vaga; o padrão (False)
+                falha na hora, para não travar a thread da GUI
+            block_timeout: Tempo máximo de espera por uma vaga
             **kwargs: Argumentos nomeados da função
             
         Returns:
             task_id: ID único da tarefa
-        """
-        with self._lock:
-            self._task_counter += 1
-            task_id = f"task_{self._task_counter}_{int(time.time())}"
             
+        Raises:
+            queue.Full: ThreadPool sem vagas para novas tarefas
+        """
+        task_id = f"task_{self._task_seq()}"
         if task_name:
             task_id = f"{task_name}_{task_id}"
             
@@ -131,18 +211,29 @@ class ThreadManager(QObject):
             if use_qthread:
                 # Usa QThread para tarefas que precisam de sinais Qt
                 worker = WorkerThread(task_id, func, *args, **kwargs)
-                worker.progress_updated.connect(lambda tid, p: self.task_progress.emit(tid, p))
-                worker.status_updated.connect(lambda tid, s: self.task_status.emit(tid, s))
-                worker.task_completed.connect(self._on_task_completed)
-                worker.finished.connect(lambda: self._cleanup_thread(task_id))
+                # Conexões sinal-a-sinal: o Qt repassa sem passar por código Python
+                worker.progress_updated.connect(self.task_progress)
+                worker.status_updated.connect(self.task_status)
+                worker.task_completed.connect(self.task_completed)
+                worker.finished.connect(functools.partial(self._cleanup_thread, task_id))
 
-                self.active_threads[task_id] = worker
+                with self._lock:
+                    self.active_threads[task_id] = worker
                 worker.start()
 
             else:
                 # Usa ThreadPool para tarefas simples
-                future = self.thread_pool.submit(self._execute_task, task_id, func, *args, **kwargs)
-                self.active_futures[task_id] = future
+                if not self._pool_slots.acquire(block, block_timeout):
+                    raise queue.Full("ThreadPool sem vagas para novas tarefas")
+                try:
+                    future = self.thread_pool.submit(self._execute_task, task_id, func, *args, **kwargs)
+                except Exception:
+                    self._pool_slots.release()
+                    raise
+                with self._lock:
+                    self.active_futures[task_id] = future
+                # Remove a tarefa assim que terminar (sem varredura periódica)
+                future.add_done_callback(functools.partial(self._retire_future, task_id))
                 
             self.task_started.emit(task_id)
             self.logger.debug(f"Tarefa {task_id} submetida")
@@ -154,17 +245,24 @@ class ThreadManager(QObject):
             raise
             
     def _execute_task(self, task_id: str, func: Callable, *args, **kwargs) -> Any:
-        """Executa uma tarefa no ThreadPool"""
+        """Executa uma tarefa no ThreadPool
+        
+        Falhas são entregues pelo TaskResult (task_completed) e não são relançadas:
+        o resultado do Future nunca é lido, então a exceção só custaria outro traceback.
+        """
+        callbacks = None
         try:
             self.task_status.emit(task_id, "Executando...")
             
             # Adiciona callbacks se não existirem
-            if 'progress_callback' not in kwargs:
-                kwargs['progress_callback'] = lambda p: self.task_progress.emit(task_id, p)
-            if 'status_callback' not in kwargs:
-                kwargs['status_callback'] = lambda s: self.task_status.emit(task_id, s)
+            if 'progress_callback' not in kwargs or 'status_callback' not in kwargs:
+                callbacks = _TaskCallbacks(task_id, self.task_progress, self.task_status)
+                kwargs.setdefault('progress_callback', callbacks.report_progress)
+                kwargs.setdefault('status_callback', callbacks.report_status)
                 
             result = func(*args, **kwargs)
+            if callbacks:
+                callbacks.flush()
             
             # Emite resultado
             task_result = TaskResult(task_id, True, result)
@@ -175,33 +273,23 @@ class ThreadManager(QObject):
             
         except Exception as e:
             self.logger.error(f"Erro na execução da tarefa {task_id}: {e}")
+            if callbacks:
+                callbacks.flush()
             task_result = TaskResult(task_id, False, None, str(e))
             self.task_completed.emit(task_result)
             self.task_status.emit(task_id, f"Erro: {str(e)}")
-            raise
+            return None
             
-    def _on_task_completed(self, result: TaskResult):
-        """Callback quando uma tarefa QThread é concluída"""
-        self.task_completed.emit(result)
-        
     def _cleanup_thread(self, task_id: str):
         """Remove thread finalizada"""
-        if task_id in self.active_threads:
-            del self.active_threads[task_id]
-            
-    def _cleanup_finished_tasks(self):
-        """Limpa tarefas finalizadas do ThreadPool"""
-        finished_tasks = []
-        
-        for task_id, future in self.active_futures.items():
-            if future.done():
-                finished_tasks.append(task_id)
-                
-        for task_id in finished_tasks:
-            del self.active_futures[task_id]
+        with self._lock:
+            self.active_threads.pop(task_id, None)
             
-        if finished_tasks:
-            self.logger.debug(f"Limpeza: {len(finished_tasks)} tarefas removidas")
+    def _retire_future(self, task_id: str, future: Future):
+        """Remove tarefa concluída do ThreadPool (done callback do Future)"""
+        with self._lock:
+            self.active_futures.pop(task_id, None)
+        self._pool_slots.release()
             
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -224,11 +312,8 @@ class ThreadManager(QObject):
                 
             # Tenta cancelar Future
             if task_id in self.active_futures:
-                future = self.active_futures[task_id]
-                cancelled = future.cancel()
-                if cancelled:
-                    del self.active_futures[task_id]
-                return cancelled
+                # Se cancelado, o done callback remove a tarefa de active_futures
+                return self.active_futures[task_id].cancel()
                 
             return False
             
@@ -240,17 +325,27 @@ class ThreadManager(QObject):
         """Cancela todas as tarefas ativas"""
         self.logger.info("Cancelando todas as tarefas...")
         
-        # Cancela QThreads
-        for task_id in list(self.active_threads.keys()):
-            self.cancel_task(task_id)
+        # Uma única cópia sob o lock; o cancelamento acontece fora dele
+        with self._lock:
+            threads = list(self.active_threads.values())
+            futures = list(self.active_futures.values())
             
-        # Cancela Futures
-        for task_id in list(self.active_futures.keys()):
-            self.cancel_task(task_id)
+        # Cancela QThreads: sinaliza todas antes de esperar, para encerrarem em paralelo
+        # (as entradas saem de active_threads pelo sinal finished)
+        for thread in threads:
+            thread.cancel()
+            thread.quit()
+        for thread in threads:
+            thread.wait(3000)  # Espera até 3 segundos
+            
+        # Cancela Futures (o done callback remove os cancelados)
+        for future in futures:
+            future.cancel()
             
     def get_active_tasks(self) -> List[str]:
         """Retorna lista de tarefas ativas"""
-        return list(self.active_threads.keys()) + list(self.active_futures.keys())
+        with self._lock:
+            return list(self.active_threads) + list(self.active_futures)
         
     def get_task_count(self) -> Dict[str, int]:
         """Retorna contagem de tarefas"""
@@ -265,28 +360,18 @@ class ThreadManager(QObject):
         Finaliza o gerenciador de threads
         
         Args:
-            wait: Se deve esperar as tarefas terminarem
-            timeout: Tempo limite para espera
+            wait: Se deve esperar as tarefas em execução terminarem
+            timeout: Mantido por compatibilidade; o ThreadPoolExecutor não
+                suporta tempo limite no shutdown
         """
         self.logger.info("Finalizando ThreadManager...")
         
-        # Para o timer de limpeza
-        self.cleanup_timer.stop()
-        
-        # Cancela todas as tarefas
+        # Cancela todas as tarefas (QThreads e futures já conhecidas)
         self.cancel_all_tasks()
         
-        # Aguarda futures se solicitado
-        if wait and timeout is not None and self.active_futures:
-            remaining = list(self.active_futures.values())
-            done, not_done = wait(remaining, timeout=timeout)
-            if not_done:
-                self.logger.warning(f"{len(not_done)} tarefas não finalizaram dentro do timeout; cancelando...")
-                for future in not_done:
-                    future.cancel()
-
-        # Finaliza ThreadPool (timeout não suportado diretamente)
-        self.thread_pool.shutdown(wait=wait)
+        # Descarta o que ainda estiver na fila do pool e, se solicitado,
+        # aguarda apenas as tarefas que já estão em execução
+        self.thread_pool.shutdown(wait=wait, cancel_futures=True)
         
         self.logger.info("ThreadManager finalizado")
 
@@ -11,14 +11,65 @@ import os
 from PySide6.QtWidgets import QApplication, QSplashScreen, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGraphicsOpacityEffect
 from PySide6.QtCore import Qt, QTimer, QPointF, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QIcon, QFont, QPixmap, QTransform, QPainter, QPen, QColor
-import math
-from ui.main_window import MainWindow
-from core.system_monitor import SystemMonitor
 from core.thread_manager import get_thread_manager, shutdown_thread_manager
 from utils.config import Config
 from utils.logger import Logger
 from utils.system_integration import ensure_admin, apply_debug_mode, is_admin
 
+# Spinner do splash: segmentos espaçados de 360/SPINNER_SEGMENTS graus
+SPINNER_SEGMENTS = 12
+SPINNER_COLOR = '#F0F6FC'
+
+# Arquivos de imagem usados na inicialização (relativos à pasta do programa)
+ASSET_PATHS = {
+    'icon': ('img', 'imgif.ico'),
+    'icon_fallback': ('assets', 'icon.ico'),
+    'splash': ('img', 'splash.webp'),
+}
+
+def _render_spinner_frames(size: int) -> list:
+    """Pré-renderiza os quadros do spinner do splash
+    
+    O spinner gira um segmento por quadro, então só existem SPINNER_SEGMENTS
+    quadros distintos: são desenhados uma vez e reutilizados pelo timer.
+    """
+    step = 360.0 / SPINNER_SEGMENTS
+
+    # Uma caneta por segmento (opacidade crescente ao longo do arco)
+    pens = []
+    for i in range(SPINNER_SEGMENTS):
+        color = QColor(SPINNER_COLOR)
+        color.setAlpha(int(255 * ((i + 1) / SPINNER_SEGMENTS)))
+        pen = QPen(color)
+        pen.setWidth(3)
+        pens.append(pen)
+
+    center_x = size / 2.0
+    center_y = size / 2.0
+    radius = size * 0.4
+
+    # Segmento no eixo x; a rotação fica a cargo da transformação do QPainter
+    inner = QPointF(radius * 0.4, 0.0)
+    outer = QPointF(radius, 0.0)
+
+    frames = []
+    for frame in range(SPINNER_SEGMENTS):
+        pix = QPixmap(size, size)
+        pix.fill(Qt.transparent)
+
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(center_x, center_y)
+        painter.rotate((frame + 1) * step)
+        for pen in pens:
+            painter.setPen(pen)
+            painter.drawLine(inner, outer)
+            painter.rotate(step)
+
+        painter.end()
+        frames.append(pix)
+    return frames
+
 class FPSPackPanel:
     def __init__(self):
         self.app = QApplication(sys.argv)
@@ -41,19 +92,27 @@ class FPSPackPanel:
         font = QFont("Segoe UI", 10)
         self.app.setFont(font)
         
-        # Define ícone da aplicação — prioriza img/imgif.ico, com fallback para assets/icon.ico
+        # Resolve os caminhos das imagens uma única vez; run() reutiliza o resultado
         base_dir = os.path.dirname(__file__)
-        preferred_icon = os.path.join(base_dir, "img", "imgif.ico")
-        fallback_icon = os.path.join(base_dir, "assets", "icon.ico")
-
-        if os.path.exists(preferred_icon):
-            self.app.setWindowIcon(QIcon(preferred_icon))
-        elif os.path.exists(fallback_icon):
-            self.app.setWindowIcon(QIcon(fallback_icon))
+        self._assets = {key: os.path.join(base_dir, *parts) for key, parts in ASSET_PATHS.items()}
+        self._asset_exists = {key: os.path.exists(path) for key, path in self._assets.items()}
+        
+        # Define ícone da aplicação — prioriza img/imgif.ico, com fallback para assets/icon.ico
+        if self._asset_exists['icon']:
+            self.app.setWindowIcon(QIcon(self._assets['icon']))
+        elif self._asset_exists['icon_fallback']:
+            self.app.setWindowIcon(QIcon(self._assets['icon_fallback']))
     
     def initialize_components(self):
-        """Inicializa os componentes principais"""
+        """Inicializa os componentes principais
+        
+        A janela principal e o monitor (PySide6 widgets, psutil, motores de
+        otimização) são importados aqui, depois que o splash já está na tela.
+        """
         try:
+            from ui.main_window import MainWindow
+            from core.system_monitor import SystemMonitor
+            
             # Inicializa configurações
             Config.load()
             
@@ -75,13 +134,11 @@ class FPSPackPanel:
     
     def run(self):
         """Executa a aplicação"""
-        if not self.initialize_components():
-            sys.exit(1)
-        # Se houver uma imagem de splash, exibe por 4 segundos antes de mostrar a janela
-        splash_path = os.path.join(os.path.dirname(__file__), "img", "splash.webp")
-        if os.path.exists(splash_path):
+        # Se houver uma imagem de splash, exibe por 4 segundos antes de mostrar a janela;
+        # os componentes são carregados enquanto ele está visível
+        if self._asset_exists['splash']:
             try:
-                pix = QPixmap(splash_path)
+                pix = QPixmap(self._assets['splash'])
                 # Reduz tamanho do splash para largura máxima 640 mantendo proporção
                 scaled_pix = pix.scaled(640, 360, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
@@ -131,42 +188,14 @@ class FPSPackPanel:
                 spinner_size = 40
                 spinner_label.setFixedSize(spinner_size, spinner_size)
 
-                # Parâmetros do spinner
-                num_segments = 12
-                angle = {"v": 0}
+                # Quadros do spinner desenhados uma única vez
+                spinner_frames = _render_spinner_frames(spinner_size)
+                frame_index = {"v": 0}
 
                 def rotate_step():
                     try:
-                        angle["v"] = (angle["v"] + 30) % 360
-                        size = spinner_label.width()
-                        pix = QPixmap(size, size)
-                        pix.fill(Qt.transparent)
-
-                        painter = QPainter(pix)
-                        painter.setRenderHint(QPainter.Antialiasing)
-
-                        center_x = size / 2.0
-                        center_y = size / 2.0
-                        radius = size * 0.4
-
-                        for i in range(num_segments):
-                            seg_angle = math.radians(angle["v"] + (i * (360.0 / num_segments)))
-                            alpha = int(255 * ((i + 1) / num_segments))
-                            pen = QPen(QColor('#F0F6FC'))
-                            pen.setWidth(3)
-                            color = QColor('#F0F6FC')
-                            color.setAlpha(alpha)
-                            pen.setColor(color)
-                            painter.setPen(pen)
-
-                            x1 = center_x + math.cos(seg_angle) * (radius * 0.4)
-                            y1 = center_y + math.sin(seg_angle) * (radius * 0.4)
-                            x2 = center_x + math.cos(seg_angle) * radius
-                            y2 = center_y + math.sin(seg_angle) * radius
-                            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
-                        painter.end()
-                        spinner_label.setPixmap(pix)
+                        spinner_label.setPixmap(spinner_frames[frame_index["v"]])
+                        frame_index["v"] = (frame_index["v"] + 1) % SPINNER_SEGMENTS
                     except Exception:
                         pass
 
@@ -174,7 +203,13 @@ class FPSPackPanel:
                 spinner_timer.timeout.connect(rotate_step)
                 spinner_timer.start(60)
 
-                # Aplica efeito de fade-in ao splash
+                def _initialize_behind_splash():
+                    if not self.initialize_components():
+                        splash_widget.close()
+                        self.app.exit(1)
+
+                # Aplica efeito de fade-in ao splash; a inicialização (que bloqueia o
+                # loop de eventos) começa quando o splash já está totalmente visível
                 try:
                     opacity_effect = QGraphicsOpacityEffect(splash_widget)
                     splash_widget.setGraphicsEffect(opacity_effect)
@@ -185,13 +220,18 @@ class FPSPackPanel:
                     fade_anim.setEasingCurve(QEasingCurve.InOutQuad)
                     # Mantém referência para não ser coletado
                     splash_widget._fade_anim = fade_anim
+                    fade_anim.finished.connect(_initialize_behind_splash)
                     splash_widget.show()
                     fade_anim.start()
                 except Exception:
                     splash_widget.show()
+                    QTimer.singleShot(0, _initialize_behind_splash)
                 self.app.processEvents()
 
                 def _finish_splash():
+                    # Inicialização falhou: a aplicação já está encerrando
+                    if self.main_window is None:
+                        return
                     try:
                         spinner_timer.stop()
                     except Exception:
@@ -273,6 +313,8 @@ class FPSPackPanel:
                 self.logger.error(f"Erro ao exibir splash: {e}")
 
         # Fallback: mostra janela normalmente
+        if self.main_window is None and not self.initialize_components():
+            sys.exit(1)
         self.main_window.show()
         
         # Inicia monitoramento do sistema
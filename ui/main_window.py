@@ -5,11 +5,15 @@ Janela Principal do FPSPACK PANEL
 Interface moderna com tema dark e animações
 """
 
+import re
+import time
+import queue
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QGridLayout, QPushButton, QLabel, QProgressBar,
                                QTabWidget, QFrame, QScrollArea, QGroupBox,
                                QSlider, QComboBox, QCheckBox, QTextEdit,
-                               QSystemTrayIcon, QMenu, QMessageBox)
+                               QSystemTrayIcon, QMenu, QMessageBox,
+                               QButtonGroup, QStackedWidget)
 from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, Signal, QEvent
 from PySide6.QtGui import QFont, QPixmap, QPalette, QColor, QIcon, QLinearGradient
 from ui.widgets.dashboard_widget import DashboardWidget
@@ -22,9 +26,32 @@ from ui.styles.dark_theme import DarkTheme
 from utils.config import Config
 from core.optimization_engine import OptimizationEngine
 from core.cleanup_engine import CleanupEngine
+from core.thread_manager import get_thread_manager
 from utils.animations import AnimationManager
 
+# Trocas de aba mais próximas que isso (s) não disparam a animação de fade
+TAB_FADE_MIN_INTERVAL = 0.15
+
+# Intervalo (ms) entre as verificações da limpeza automática de RAM; bem abaixo
+# de RAM_PRESSURE_HOLD para que a pressão sustentada seja percebida a tempo
+AUTO_RAM_CHECK_INTERVAL_MS = 10000
+
+# Cores de destaque disponíveis nas configurações: (primária, secundária)
+ACCENT_PALETTE = {
+    "azul": ("#00D4FF", "#8B5CF6"),
+    "roxo": ("#8B5CF6", "#C084FC"),
+    "verde": ("#00FF88", "#43FFAF"),
+    "vermelho": ("#FF4757", "#FF6B81"),
+    "laranja": ("#FFA726", "#FFC371"),
+}
+
+# Ocorrências das cores de destaque do DarkTheme (hex e prefixos rgba)
+ACCENT_TOKENS = re.compile(r"#00D4FF|#8B5CF6|rgba\(0, ?212, ?255|rgba\(139, ?92, ?246")
+
 class MainWindow(QMainWindow):
+    # Stylesheet já processada por cor de destaque (compartilhada entre instâncias)
+    _theme_cache = {}
+
     def __init__(self, system_monitor):
         super().__init__()
         self.system_monitor = system_monitor
@@ -32,6 +59,8 @@ class MainWindow(QMainWindow):
         self.cleanup_engine = CleanupEngine()
         self.animation_manager = AnimationManager()
         self.config = Config()
+        self._last_accent = None
+        self._last_switch = 0.0
         
         # Configurar janela sem frame padrão
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
@@ -41,14 +70,13 @@ class MainWindow(QMainWindow):
         self.setup_connections()
         self.setup_system_tray()
         self.apply_theme()
+        self.setup_auto_ram_clean()
 
     def show_shutdown_overlay(self):
         """Exibe animação enquanto os processos de encerramento são finalizados."""
         if getattr(self, "_shutdown_overlay", None):
             return
 
-        from PySide6.QtWidgets import QApplication
-
         overlay = QWidget(self)
         overlay.setObjectName("shutdown_overlay")
         overlay.setAttribute(Qt.WA_StyledBackground, True)
@@ -93,9 +121,9 @@ class MainWindow(QMainWindow):
         container_layout.addWidget(progress, alignment=Qt.AlignCenter)
         layout.addWidget(container)
 
+        # show() agenda a pintura; ela acontece no próximo ciclo do loop de eventos
         overlay.show()
         overlay.raise_()
-        QApplication.processEvents()
         self._shutdown_overlay = overlay
 
     def setup_ui(self):
@@ -159,8 +187,10 @@ class MainWindow(QMainWindow):
         
         sidebar_layout.addSpacing(30)
         
-        # Botões de navegação
+        # Botões de navegação (grupo exclusivo: o Qt desmarca os demais)
         self.nav_buttons = {}
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
         nav_items = [
             ("dashboard", "🏠 Dashboard", True),
             ("optimization", "⚡ Otimização", False),
@@ -169,14 +199,17 @@ class MainWindow(QMainWindow):
             ("about", "ℹ️ Sobre", False)
         ]
         
-        for key, text, is_active in nav_items:
+        self._nav_keys = []
+        for index, (key, text, is_active) in enumerate(nav_items):
             btn = QPushButton(text)
             btn.setObjectName("nav_button")
             btn.setCheckable(True)
             btn.setChecked(is_active)
-            btn.clicked.connect(lambda checked, k=key: self.switch_tab(k))
+            self.nav_group.addButton(btn, index)
+            self._nav_keys.append(key)
             self.nav_buttons[key] = btn
             sidebar_layout.addWidget(btn)
+        self.nav_group.idClicked.connect(lambda index: self.switch_tab(self._nav_keys[index]))
         
         sidebar_layout.addStretch()
         
@@ -199,30 +232,42 @@ class MainWindow(QMainWindow):
         # Header com informações do sistema
         self.create_header(content_layout)
         
-        # Stack de widgets para diferentes abas
-        self.content_stack = QWidget()
-        self.stack_layout = QVBoxLayout(self.content_stack)
-        self.stack_layout.setContentsMargins(0, 0, 0, 0)
+        # Stack de widgets para diferentes abas (exibe apenas a aba atual)
+        self.content_stack = QStackedWidget()
+        
+        # Widgets das abas: criados na primeira visita (ver _get_tab_widget);
+        # na inicialização só o dashboard é construído
+        self._widget_factories = {
+            "dashboard": lambda: DashboardWidget(self.system_monitor),
+            "optimization": lambda: OptimizationWidget(self.optimization_engine),
+            "cleanup": lambda: CleanupWidget(self.cleanup_engine),
+            "settings": self._create_settings_widget,
+            "about": AboutWidget
+        }
+        self.widgets = {}
+        self.settings_widget = None
+        self._get_tab_widget("dashboard")
         
-        # Widgets das abas
+        content_layout.addWidget(self.content_stack)
+        parent_layout.addWidget(content_frame)
+        
+    def _create_settings_widget(self):
+        """Cria o widget de configurações já conectado à reaplicação do tema"""
         settings_widget = SettingsWidget()
         settings_widget.settings_changed.connect(self.on_settings_changed)
-        self.widgets = {
-            "dashboard": DashboardWidget(self.system_monitor),
-            "optimization": OptimizationWidget(self.optimization_engine),
-            "cleanup": CleanupWidget(self.cleanup_engine),
-            "settings": settings_widget,
-            "about": AboutWidget()
-        }
         self.settings_widget = settings_widget
+        return settings_widget
         
-        # Adiciona widgets ao stack (inicialmente apenas dashboard visível)
-        for key, widget in self.widgets.items():
-            widget.setVisible(key == "dashboard")
-            self.stack_layout.addWidget(widget)
-        
-        content_layout.addWidget(self.content_stack)
-        parent_layout.addWidget(content_frame)
+    def _get_tab_widget(self, tab_key):
+        """Retorna o widget da aba, criando-o e adicionando ao stack na primeira vez"""
+        widget = self.widgets.get(tab_key)
+        if widget is None:
+            widget = self._widget_factories[tab_key]()
+            if hasattr(widget, 'status_updated'):
+                widget.status_updated.connect(self.show_status_message)
+            self.content_stack.addWidget(widget)
+            self.widgets[tab_key] = widget
+        return widget
         
     def create_header(self, parent_layout):
         """Cria o cabeçalho com informações do sistema"""
@@ -235,25 +280,23 @@ class MainWindow(QMainWindow):
         
         # Informações do sistema
         system_info = QHBoxLayout()
+        # Último texto aplicado em cada label (evita setText com valor repetido)
+        self._header_texts = {}
         
         # CPU
-        cpu_frame = self.create_info_frame("CPU", "0%")
-        self.cpu_label = cpu_frame.findChild(QLabel, "value")
+        cpu_frame, self.cpu_label = self.create_info_frame("CPU", "0%")
         system_info.addWidget(cpu_frame)
         
         # RAM
-        ram_frame = self.create_info_frame("RAM", "0 GB")
-        self.ram_label = ram_frame.findChild(QLabel, "value")
+        ram_frame, self.ram_label = self.create_info_frame("RAM", "0 GB")
         system_info.addWidget(ram_frame)
         
         # Disco
-        disk_frame = self.create_info_frame("DISCO", "0%")
-        self.disk_label = disk_frame.findChild(QLabel, "value")
+        disk_frame, self.disk_label = self.create_info_frame("DISCO", "0%")
         system_info.addWidget(disk_frame)
         
         # Temperatura
-        temp_frame = self.create_info_frame("TEMP", "0°C")
-        self.temp_label = temp_frame.findChild(QLabel, "value")
+        temp_frame, self.temp_label = self.create_info_frame("TEMP", "0°C")
         system_info.addWidget(temp_frame)
         
         header_layout.addLayout(system_info)
@@ -276,7 +319,11 @@ class MainWindow(QMainWindow):
         parent_layout.addWidget(header)
         
     def create_info_frame(self, title, value):
-        """Cria um frame de informação do sistema"""
+        """Cria um frame de informação do sistema
+        
+        Returns:
+            Tupla (frame, label do valor)
+        """
         frame = QFrame()
         frame.setObjectName("info_frame")
         
@@ -294,19 +341,16 @@ class MainWindow(QMainWindow):
         value_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(value_label)
         
-        return frame
+        return frame, value_label
         
     def setup_connections(self):
         """Configura as conexões de sinais"""
-        # Timer para atualizar informações do sistema
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_system_info)
-        self.update_timer.start(1000)  # Atualiza a cada segundo
+        # O header é atualizado pelos snapshots do SystemMonitor, coletados fora
+        # da thread da GUI e entregues aqui pela conexão enfileirada
+        if self.system_monitor:
+            self.system_monitor.system_updated.connect(self.update_system_info, Qt.QueuedConnection)
         
-        # Conexões dos widgets
-        for widget in self.widgets.values():
-            if hasattr(widget, 'status_updated'):
-                widget.status_updated.connect(self.show_status_message)
+        # Conexões dos widgets das abas são feitas em _get_tab_widget
                 
     def setup_system_tray(self):
         """Configura o ícone na bandeja do sistema"""
@@ -344,27 +388,39 @@ class MainWindow(QMainWindow):
     def apply_theme(self):
         """Mantém o tema dark padrão e aplica apenas cores de destaque."""
         accent_choice = (self.config.get("ui.accent_color", "Azul") or "Azul").lower()
+        if accent_choice not in ACCENT_PALETTE:
+            accent_choice = "azul"
+        # setStyleSheet refaz o polish de toda a árvore de widgets: só aplica se mudou
+        if accent_choice == self._last_accent:
+            return
 
-        accent_palette = {
-            "azul": ("#00D4FF", "#8B5CF6"),
-            "roxo": ("#8B5CF6", "#C084FC"),
-            "verde": ("#00FF88", "#43FFAF"),
-            "vermelho": ("#FF4757", "#FF6B81"),
-            "laranja": ("#FFA726", "#FFC371"),
-        }
-        primary, secondary = accent_palette.get(accent_choice, accent_palette["azul"])
-
-        base_stylesheet = DarkTheme.get_stylesheet()
-        stylesheet = base_stylesheet.replace("#00D4FF", primary).replace("#8B5CF6", secondary)
-
-        pr, pg, pb = self._hex_to_rgb(primary)
-        sr, sg, sb = self._hex_to_rgb(secondary)
-        for prefix in ("rgba(0,212,255", "rgba(0, 212, 255"):
-            stylesheet = stylesheet.replace(prefix, f"rgba({pr},{pg},{pb}")
-        for prefix in ("rgba(139,92,246", "rgba(139, 92, 246"):
-            stylesheet = stylesheet.replace(prefix, f"rgba({sr},{sg},{sb}")
+        stylesheet = self._theme_cache.get(accent_choice)
+        if stylesheet is None:
+            stylesheet = self._build_stylesheet(accent_choice)
+            self._theme_cache[accent_choice] = stylesheet
 
         self.setStyleSheet(stylesheet)
+        self._last_accent = accent_choice
+
+    @classmethod
+    def _build_stylesheet(cls, accent_choice: str) -> str:
+        """Gera a stylesheet do DarkTheme com a cor de destaque escolhida
+        
+        Todas as cores são trocadas em uma única passada sobre o texto.
+        """
+        primary, secondary = ACCENT_PALETTE[accent_choice]
+        pr, pg, pb = cls._hex_to_rgb(primary)
+        sr, sg, sb = cls._hex_to_rgb(secondary)
+        replacements = {
+            "#00D4FF": primary,
+            "#8B5CF6": secondary,
+            "rgba(0,212,255": f"rgba({pr},{pg},{pb}",
+            "rgba(139,92,246": f"rgba({sr},{sg},{sb}",
+        }
+        return ACCENT_TOKENS.sub(
+            lambda match: replacements[match.group(0).replace(" ", "")],
+            DarkTheme.get_stylesheet()
+        )
 
     @staticmethod
     def _hex_to_rgb(hex_color: str):
@@ -378,19 +434,56 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         self.apply_theme()
+        self._apply_auto_ram_setting()
+        
+    def setup_auto_ram_clean(self):
+        """Configura a limpeza automática de RAM (optimization.auto_ram_cleanup)"""
+        self._auto_ram_task_id = None
+        self.auto_ram_timer = QTimer(self)
+        self.auto_ram_timer.setInterval(AUTO_RAM_CHECK_INTERVAL_MS)
+        self.auto_ram_timer.timeout.connect(self._auto_ram_check)
+        self._apply_auto_ram_setting()
+        
+    def _apply_auto_ram_setting(self):
+        """Liga ou desliga o timer conforme a configuração atual"""
+        if self.config.get("optimization.auto_ram_cleanup", False):
+            if not self.auto_ram_timer.isActive():
+                self.auto_ram_timer.start()
+        else:
+            self.auto_ram_timer.stop()
+            
+    def _auto_ram_check(self):
+        """Envia a verificação de pressão de RAM ao ThreadPool (uma por vez)"""
+        thread_manager = get_thread_manager()
+        if self._auto_ram_task_id in thread_manager.get_active_tasks():
+            return
+        try:
+            self._auto_ram_task_id = thread_manager.submit_task(
+                self._auto_ram_clean, task_name="auto_ram_clean", block=False
+            )
+        except queue.Full:
+            # ThreadPool ocupado: tenta de novo na próxima verificação
+            pass
+            
+    def _auto_ram_clean(self, progress_callback=None, status_callback=None):
+        """Limpa a RAM só sob pressão sustentada (executa no ThreadPool)"""
+        return self.optimization_engine.clean_ram(only_under_pressure=True)
 
     def switch_tab(self, tab_key):
         """Troca entre as abas"""
-        # Atualiza botões de navegação
-        for key, btn in self.nav_buttons.items():
-            btn.setChecked(key == tab_key)
-            
-        # Mostra/esconde widgets
-        for key, widget in self.widgets.items():
-            widget.setVisible(key == tab_key)
+        current = self._get_tab_widget(tab_key)
+        
+        # Marca o botão da aba (o grupo exclusivo desmarca o anterior)
+        self.nav_buttons[tab_key].setChecked(True)
+        
+        # Exibe a aba; o QStackedWidget esconde a anterior
+        self.content_stack.setCurrentWidget(current)
             
-        # Animação de transição
-        self.animation_manager.fade_in(self.widgets[tab_key])
+        # Animação de transição (omitida em cliques rápidos entre abas)
+        now = time.monotonic()
+        if now - self._last_switch >= TAB_FADE_MIN_INTERVAL:
+            self.animation_manager.fade_in(current)
+        self._last_switch = now
         
     def toggle_maximize(self):
         """Alterna entre maximizar e restaurar janela"""
@@ -399,15 +492,19 @@ class MainWindow(QMainWindow):
         else:
             self.showMaximized()
         
-    def update_system_info(self):
-        """Atualiza as informações do sistema no header"""
-        if self.system_monitor:
-            info = self.system_monitor.get_current_info()
-            
-            self.cpu_label.setText(f"{info['cpu_percent']:.1f}%")
-            self.ram_label.setText(f"{info['ram_used_gb']:.1f} GB")
-            self.disk_label.setText(f"{info['disk_percent']:.1f}%")
-            self.temp_label.setText(f"{info['cpu_temp']:.0f}°C")
+    def update_system_info(self, system_data):
+        """Atualiza as informações do sistema no header a partir de um snapshot do monitor"""
+        texts = (
+            (self.cpu_label, f"{system_data.get('cpu', {}).get('percent', 0):.1f}%"),
+            (self.ram_label, f"{system_data.get('memory', {}).get('used_gb', 0):.1f} GB"),
+            (self.disk_label, f"{system_data.get('disk', {}).get('percent', 0):.1f}%"),
+            (self.temp_label, f"{system_data.get('temperature', {}).get('cpu_temp', 0):.0f}°C"),
+        )
+        # Só chama setText (relayout/repaint) quando o valor exibido muda
+        for label, text in texts:
+            if self._header_texts.get(label) != text:
+                label.setText(text)
+                self._header_texts[label] = text
             
     def quick_ram_clean(self):
         """Limpeza rápida de RAM"""
@@ -466,37 +563,53 @@ class MainWindow(QMainWindow):
         self.show_shutdown_overlay()
         self.setEnabled(False)
         from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
-        # Aceita o evento e força encerramento da aplicação
+        # Aceita o evento e agenda o encerramento para depois que o loop de
+        # eventos pintar o overlay (sem processEvents reentrante)
         event.accept()
         try:
-            QApplication.quit()
+            QTimer.singleShot(0, QApplication.quit)
         except Exception:
             # Fallback para encerrar processo
             import sys
             sys.exit(0)
 
+    def _start_updates(self):
+        """Retoma o monitoramento (e, com ele, a atualização do header)"""
+        if self.system_monitor:
+            self.system_monitor.start_monitoring()
+
+    def _stop_updates(self):
+        """Pausa o monitoramento (e, com ele, a atualização do header)"""
+        if self.system_monitor:
+            self.system_monitor.stop_monitoring()
+
+    def showEvent(self, event):
+        """Retoma o monitoramento quando a janela é exibida"""
+        self._start_updates()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Pausa o monitoramento quando a janela é escondida"""
+        self._stop_updates()
+        super().hideEvent(event)
+
     def changeEvent(self, event):
         """Detecta mudança de estado da janela (minimizado/restaurado)"""
         if event.type() == QEvent.WindowStateChange:
             if self.isMinimized():
-                if self.system_monitor:
-                    self.system_monitor.stop_monitoring()
+                self._stop_updates()
             elif self.isVisible():
-                if self.system_monitor:
-                    self.system_monitor.start_monitoring()
+                self._start_updates()
         super().changeEvent(event)
 
     def focusInEvent(self, event):
         """Retoma monitoramento ao focar (janela recebeu foco)"""
-        if self.system_monitor:
-            self.system_monitor.start_monitoring()
+        self._start_updates()
         super().focusInEvent(event)
 
     def focusOutEvent(self, event):
         """Pausa monitoramento ao perder foco (janela perdeu foco)"""
-        if self.system_monitor:
-            self.system_monitor.stop_monitoring()
+        self._stop_updates()
         super().focusOutEvent(event)
 
     def _tray_quit(self):
@@ -15,6 +15,7 @@ from core.thread_manager import get_thread_manager
 from utils.logger import Logger
 from .toggle_switch import ToggleSwitch
 import time
+import queue
 
 class CleanupWidget(QWidget):
     """Widget principal de limpeza"""
@@ -234,11 +235,15 @@ class CleanupWidget(QWidget):
             'engine': self.cleanup_engine
         }
         
-        self.current_task_id = self.thread_manager.submit_task(
-            self._execute_cleanup_task,
-            task_data,
-            task_name="cleanup_task"
-        )
+        try:
+            self.current_task_id = self.thread_manager.submit_task(
+                self._execute_cleanup_task,
+                task_data,
+                task_name="cleanup_task"
+            )
+        except queue.Full:
+            QMessageBox.warning(self, "Aviso", "Muitas tarefas em andamento. Tente novamente em instantes.")
+            return
         
         # Conecta sinais
         self.thread_manager.task_progress.connect(self._on_progress_update)
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
 import random
+from collections import deque
 from typing import Dict, List
 from utils.logger import Logger
 
@@ -23,8 +24,8 @@ class SimulatedGraphWidget(QWidget):
         self.title = title
         self.color = color
         self.unit = unit
-        self.history = []
         self.max_points = 60
+        self.history = deque(maxlen=self.max_points)
 
         # Estado interno liso (EMA)
         self._value = 0.0
@@ -108,8 +109,6 @@ class SimulatedGraphWidget(QWidget):
 
         # Mantém histórico do valor suavizado
         self.history.append(self._value)
-        if len(self.history) > self.max_points:
-            self.history.pop(0)
 
         # Atualiza barra e labels
         display = self._value
@@ -123,7 +122,7 @@ class SimulatedGraphWidget(QWidget):
         )
 
         # Histórico textual (mostra os últimos 6 valores arredondados)
-        recent = [f"{v:.0f}%" for v in self.history[-6:]]
+        recent = [f"{v:.0f}%" for v in list(self.history)[-6:]]
         self.history_label.setText(" | ".join(recent))
 
 class SystemInfoCard(QFrame):
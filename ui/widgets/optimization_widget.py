@@ -16,6 +16,7 @@ from utils.logger import Logger
 from utils.config import Config
 from .toggle_switch import ToggleSwitch
 import time
+import queue
 
 
 
@@ -237,12 +238,16 @@ class OptimizationWidget(QWidget):
             options[key] = checkbox.isChecked()
             
         # Submete tarefa para o ThreadManager (não usa QThread por padrão)
-        self.current_task_id = self.thread_manager.submit_task(
-            self._execute_optimization,
-            optimization_type,
-            options,
-            task_name=f"optimization_{optimization_type}"
-        )
+        try:
+            self.current_task_id = self.thread_manager.submit_task(
+                self._execute_optimization,
+                optimization_type,
+                options,
+                task_name=f"optimization_{optimization_type}"
+            )
+        except queue.Full:
+            QMessageBox.warning(self, "Aviso", "Muitas tarefas em andamento. Tente novamente em instantes.")
+            return
 
         # Mostra progresso
         self.progress_bar.setVisible(True)
@@ -384,11 +389,15 @@ class OptimizationWidget(QWidget):
         plan_type = plan_mapping.get(plan_text, "balanced")
         
         # Executa aplicação do plano
-        self.current_task_id = self.thread_manager.submit_task(
-            self._execute_power_plan,
-            plan_type,
-            task_name=f"power_plan_{plan_type}"
-        )
+        try:
+            self.current_task_id = self.thread_manager.submit_task(
+                self._execute_power_plan,
+                plan_type,
+                task_name=f"power_plan_{plan_type}"
+            )
+        except queue.Full:
+            QMessageBox.warning(self, "Aviso", "Muitas tarefas em andamento. Tente novamente em instantes.")
+            return
         
         # Mostra progresso
         self.progress_bar.setVisible(True)
@@ -438,11 +447,15 @@ class OptimizationWidget(QWidget):
             return
             
         # Executa otimizações selecionadas
-        self.current_task_id = self.thread_manager.submit_task(
-            self._execute_selected_optimizations,
-            selected_options,
-            task_name="selected_optimizations"
-        )
+        try:
+            self.current_task_id = self.thread_manager.submit_task(
+                self._execute_selected_optimizations,
+                selected_options,
+                task_name="selected_optimizations"
+            )
+        except queue.Full:
+            QMessageBox.warning(self, "Aviso", "Muitas tarefas em andamento. Tente novamente em instantes.")
+            return
         
         # Mostra progresso
         self.progress_bar.setVisible(True)
@@ -15,9 +15,17 @@ class AnimationManager:
     
     def __init__(self):
         self.animations = []
+        # fade_in em andamento: só uma por vez, a anterior é finalizada
+        self._active_fade: Optional[QPropertyAnimation] = None
         
     def fade_in(self, widget, duration: int = 300):
         """Animação de fade in"""
+        # Leva a fade anterior ao valor final (opacidade 1) antes de parar,
+        # para o widget anterior não ficar semitransparente
+        if self._active_fade is not None and self._active_fade.state() == QPropertyAnimation.Running:
+            self._active_fade.setCurrentTime(self._active_fade.duration())
+            self._active_fade.stop()
+            
         effect = QGraphicsOpacityEffect()
         widget.setGraphicsEffect(effect)
         
@@ -27,7 +35,7 @@ class AnimationManager:
         animation.setEndValue(1.0)
         animation.setEasingCurve(QEasingCurve.OutCubic)
         
-        self.animations.append(animation)
+        self._active_fade = animation
         animation.start()
         
     def fade_out(self, widget, duration: int = 300):
@@ -125,6 +133,9 @@ class AnimationManager:
         
     def stop_all_animations(self):
         """Para todas as animações"""
+        if self._active_fade is not None:
+            self._active_fade.stop()
+            self._active_fade = None
         for animation in self.animations:
             if animation.state() == QPropertyAnimation.Running:
                 animation.stop()
@@ -14,6 +14,7 @@ Centraliza operações sensíveis ao sistema como:
 from __future__ import annotations
 
 import ctypes
+from ctypes import wintypes
 import os
 import shutil
 import subprocess
@@ -26,8 +27,14 @@ from utils.config import get_appdata_root
 
 if os.name == "nt":
     import winreg  # type: ignore
+
+    _dnsapi = ctypes.WinDLL("dnsapi")
+    _DnsFlushResolverCache = _dnsapi.DnsFlushResolverCache
+    _DnsFlushResolverCache.argtypes = []
+    _DnsFlushResolverCache.restype = wintypes.BOOL
 else:  # pragma: no cover - Non Windows fallback
     winreg = None  # type: ignore
+    _DnsFlushResolverCache = None
 
 RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 APP_STARTUP_VALUE = "FPSPACKPanel"
@@ -49,6 +56,21 @@ def is_admin() -> bool:
         return False
 
 
+def flush_dns_cache() -> bool:
+    """
+    Limpa o cache do resolvedor DNS em processo (DnsFlushResolverCache).
+    É a mesma API usada pelo ``ipconfig /flushdns``; retorna False quando ela
+    não está disponível ou falha, para o chamador recorrer ao ipconfig.
+    """
+    if _DnsFlushResolverCache is None:
+        return False
+
+    try:
+        return bool(_DnsFlushResolverCache())
+    except OSError:
+        return False
+
+
 def get_launch_command() -> str:
     """
     Retorna o comando usado para iniciar o painel.